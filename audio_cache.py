@@ -0,0 +1,179 @@
+"""Synthesize each spoken sentence once and replay it from disk.
+
+pyttsx3 renders a reply into a WAV with save_to_file(); the file is kept
+under a name derived from the text, the voice and the rate, so the
+greeting, the fallback and every FAQ answer are synthesized once per
+voice and afterwards start playing as soon as the file is opened.
+
+    TECHNOVATE_AUDIO_CACHE=/var/cache/technovate   # where the WAVs live
+    TECHNOVATE_AUDIO_CACHE=off                     # always speak live
+
+Playback uses simpleaudio if it is installed, winsound on Windows,
+otherwise afplay / aplay / paplay. With none of them the cache is
+unavailable and speech goes straight to the engine as before.
+"""
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import wave
+
+DEFAULT_DIRECTORY = os.environ.get(
+    "TECHNOVATE_AUDIO_CACHE", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".audio_cache"))
+_POLL = 0.02  # seconds between "interrupted?" checks while a file plays
+
+
+# ----------------- Playback Backends -----------------
+def _play_simpleaudio(path, should_stop):
+    import simpleaudio
+
+    playback = simpleaudio.WaveObject.from_wave_file(path).play()
+    while playback.is_playing():
+        if should_stop():
+            playback.stop()
+            return False
+        time.sleep(_POLL)
+    return True
+
+
+def _play_winsound(path, should_stop):
+    import winsound
+
+    with wave.open(path, "rb") as audio:
+        duration = audio.getnframes() / float(audio.getframerate())
+    winsound.PlaySound(path, winsound.SND_FILENAME | winsound.SND_ASYNC)
+    finish = time.perf_counter() + duration
+    while time.perf_counter() < finish:
+        if should_stop():
+            winsound.PlaySound(None, 0)
+            return False
+        time.sleep(_POLL)
+    return True
+
+
+def _command_player(command):
+    def play(path, should_stop):
+        process = subprocess.Popen(command + [path], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        while process.poll() is None:
+            if should_stop():
+                process.terminate()
+                process.wait()
+                return False
+            time.sleep(_POLL)
+        return process.returncode == 0
+    return play
+
+
+def find_player():
+    """play(path, should_stop) -> finished?, for the first backend this machine has, or None."""
+    try:
+        import simpleaudio  # noqa: F401
+        return _play_simpleaudio
+    except ImportError:
+        pass
+    if sys.platform == "win32":
+        return _play_winsound
+    for command in (["afplay"], ["aplay", "-q"], ["paplay"]):
+        if shutil.which(command[0]):
+            return _command_player(command)
+    return None
+
+
+# ----------------- On-Disk Audio Cache -----------------
+class AudioCache:
+    """WAV files keyed by (text, voice, rate) in one directory.
+
+    lookup() and play() may be called from any thread; synthesize() drives
+    the pyttsx3 engine and must run on the thread that owns it. The player
+    is looked for on first use, so a front-end running text-only never
+    probes for one.
+    """
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, player=None):
+        self.directory = directory
+        self.__player = player
+        self.__searched = player is not None
+        self.__lock = threading.Lock()
+        self.__known = set()  # paths seen on disk, to skip the stat on repeat lookups
+
+    @property
+    def available(self):
+        """False when caching is switched off or nothing can play the files."""
+        return self.directory.lower() not in ("", "0", "off") and self.__find_player() is not None
+
+    def __find_player(self):
+        if not self.__searched:
+            with self.__lock:
+                if not self.__searched:
+                    self.__player = find_player()
+                    self.__searched = True
+        return self.__player
+
+    def path(self, text, voice, rate):
+        key = hashlib.sha1(f"{voice}\0{rate}\0{text}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key + ".wav")
+
+    def lookup(self, text, voice, rate):
+        """The cached file for text, or None if it was never synthesized."""
+        path = self.path(text, voice, rate)
+        with self.__lock:
+            if path in self.__known:
+                return path
+        if os.path.isfile(path):
+            with self.__lock:
+                self.__known.add(path)
+            return path
+        return None
+
+    def synthesize(self, engine, text):
+        """Render text with engine into the cache (a no-op if it is there already); returns the path."""
+        voice, rate = engine.getProperty("voice"), engine.getProperty("rate")
+        path = self.lookup(text, voice, rate)
+        if path is not None:
+            return path
+        os.makedirs(self.directory, exist_ok=True)
+        descriptor, partial = tempfile.mkstemp(suffix=".wav", dir=self.directory)
+        os.close(descriptor)
+        try:
+            engine.save_to_file(text, partial)
+            engine.runAndWait()
+            if not os.path.getsize(partial):
+                return None  # the driver could not render this text
+            path = self.path(text, voice, rate)
+            os.replace(partial, path)  # readers never see a half-written file
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+        with self.__lock:
+            self.__known.add(path)
+        return path
+
+    def play(self, path, should_stop=lambda: False):
+        """Play a cached file, blocking; returns False if it was cut off or could not play."""
+        try:
+            return self.__find_player()(path, should_stop)
+        except Exception:
+            with self.__lock:
+                self.__known.discard(path)
+            return False
+
+    def discard(self, path):
+        """Forget one cached file (say, one that may be truncated)."""
+        with self.__lock:
+            self.__known.discard(path)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        with self.__lock:
+            self.__known.clear()
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".wav"):
+                    os.remove(os.path.join(self.directory, name))
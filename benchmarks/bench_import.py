@@ -0,0 +1,54 @@
+"""Import-time benchmark for the bot modules.
+
+Each module is imported in a fresh interpreter, first on its own (what a
+text-only or headless run pays now that the TTS engine is lazy) and then
+followed by creating the speech engine (what every import used to pay when
+pyttsx3.init() ran at module level).
+
+Run from the repository root:  python benchmarks/bench_import.py [repeats]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = ["bot_core", "main", "speaking", "gui", "new_gui_probab", "gui_probab_speech"]
+
+SNIPPET = """
+import json, time
+start = time.perf_counter()
+import {module} as module
+imported = time.perf_counter()
+engine_ms = None
+if {load_engine} and hasattr(module, "engine"):
+    try:
+        module.engine.get()
+        engine_ms = (time.perf_counter() - imported) * 1000
+    except Exception as error:
+        engine_ms = repr(error)
+print(json.dumps({{"import_ms": (imported - start) * 1000, "engine_ms": engine_ms}}))
+"""
+
+
+def measure(module, load_engine):
+    code = SNIPPET.format(module=module, load_engine=load_engine)
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"{'module':<22}{'import (ms)':>14}{'+ engine init (ms)':>22}")
+    for module in MODULES:
+        imports = [measure(module, False)["import_ms"] for _ in range(repeats)]
+        engine = measure(module, True)["engine_ms"]
+        if engine is None:
+            engine_text = "no speech"
+        elif isinstance(engine, str):
+            engine_text = "unavailable"
+        else:
+            engine_text = f"{engine:.1f}"
+        print(f"{module:<22}{statistics.median(imports):>14.1f}{engine_text:>22}")
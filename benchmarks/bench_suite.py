@@ -0,0 +1,232 @@
+"""Benchmark suite for the bot's hot paths, with machine-readable output.
+
+Times handle_query (warm and cold response cache), __extract_time,
+__find_best_match and show_schedule over a seeded synthetic corpus of
+festival questions (misspellings, time phrases, day references, noise) and
+reports per-call latency percentiles plus tracemalloc allocation figures.
+
+Run from the repository root:
+    python benchmarks/bench_suite.py --output before.json
+    ... change the matcher ...
+    python benchmarks/bench_suite.py --output after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import bot_core  # noqa: E402
+
+# Every front-end module re-exports bot_core.TechnovateBot, so this is the one
+# variant left to measure; add (name, factory) pairs here to compare others.
+VARIANTS = [("bot_core.TechnovateBot", bot_core.TechnovateBot)]
+
+
+# ----------------- Synthetic Corpus -----------------
+FAQ_QUESTIONS = [
+    "what is technovate", "tell me about the festival", "what's the theme for 2025",
+    "what was last year's theme", "how many members in a team", "what technical events are there",
+    "any coding competitions", "what cultural events are there", "is there an open mic",
+    "can students from other colleges participate", "how do i register", "how to register for events",
+    "is accommodation available", "where can i stay", "is there food at the fest", "canteen timings",
+    "how can i contact the organisers", "who are the celebrity guests", "who are the sponsors", "help",
+]
+TIME_PHRASES = [
+    "at 3pm", "at 3 PM", "at 4:30 pm", "at 15:00", "around 11 am", "at noon", "at half past four",
+    "at quarter to six", "at four o'clock", "after 5 pm", "next after 12:00", "between 2 and 6 pm",
+    "from 10 to 12", "at 9:15",
+]
+DAY_TEMPLATES = [
+    "what's on {day} {time}", "events on {day} {time}", "{day} {time}", "what is happening {time} on {day}",
+    "schedule for {day}", "{day} full schedule", "anything fun {time} {day}?", "{day} what's next {time}",
+]
+DAYS = ["day 1", "Day 2", "DAY 3", "day 2", "day 4", "day one"]
+NOISE = ["asdfgh", "lol", "is the wifi free", "what's the weather like", "ok thanks", "??"]
+
+
+def misspell(text, rng):
+    """Drop, double or swap one letter of a random word."""
+    words = text.split()
+    index = rng.randrange(len(words))
+    word = words[index]
+    if len(word) > 3:
+        position = rng.randrange(1, len(word) - 1)
+        edit = rng.choice(("drop", "double", "swap"))
+        if edit == "drop":
+            word = word[:position] + word[position + 1:]
+        elif edit == "double":
+            word = word[:position] + word[position] + word[position:]
+        else:
+            word = word[:position - 1] + word[position] + word[position - 1] + word[position + 1:]
+    words[index] = word
+    return " ".join(words)
+
+
+def build_corpus(size=2000, seed=2025):
+    """Seeded mix: ~45% FAQ (a third misspelled), ~45% day/time questions, ~10% noise."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(size):
+        roll = rng.random()
+        if roll < 0.45:
+            question = rng.choice(FAQ_QUESTIONS)
+            if rng.random() < 0.33:
+                question = misspell(question, rng)
+        elif roll < 0.9:
+            template = rng.choice(DAY_TEMPLATES)
+            question = template.format(day=rng.choice(DAYS), time=rng.choice(TIME_PHRASES)).strip()
+            if rng.random() < 0.15:
+                question = misspell(question, rng)
+        else:
+            question = rng.choice(NOISE)
+        corpus.append(question)
+    return corpus
+
+
+# ----------------- Measurement -----------------
+def latency(func, inputs, rounds):
+    samples = []
+    clock = time.perf_counter_ns
+    for _ in range(rounds):
+        for item in inputs:
+            start = clock()
+            func(item)
+            samples.append(clock() - start)
+    samples.sort()
+
+    def percentile(fraction):
+        return round(samples[min(len(samples) - 1, int(fraction * len(samples)))] / 1000, 3)
+
+    return {
+        "calls": len(samples),
+        "mean_us": round(statistics.fmean(samples) / 1000, 3),
+        "min_us": round(samples[0] / 1000, 3),
+        "p50_us": percentile(0.50),
+        "p90_us": percentile(0.90),
+        "p99_us": percentile(0.99),
+        "max_us": round(samples[-1] / 1000, 3),
+    }
+
+
+def allocations(func, inputs):
+    """Bytes allocated while answering every input once (one extra warm-up pass first)."""
+    for item in inputs:
+        func(item)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        blocks_before = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+        for item in inputs:
+            func(item)
+        after, peak = tracemalloc.get_traced_memory()
+        blocks_after = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    finally:
+        tracemalloc.stop()
+    return {
+        "peak_bytes_per_pass": peak - before,
+        "retained_bytes_per_call": round((after - before) / len(inputs), 1),
+        "retained_blocks": blocks_after - blocks_before,
+    }
+
+
+def targets(bot, corpus):
+    """(name, callable, inputs) for each hot path; private methods via their mangled names."""
+    lowered = [" ".join(query.lower().split()) for query in corpus]
+    state = bot._TechnovateBot__state
+    days = state.schedule.days() + ["day 9"]
+    find_best_match = bot._TechnovateBot__find_best_match
+
+    def cold_handle_query(query):
+        bot.response_cache.clear()
+        return bot.handle_query(query)
+
+    return [
+        ("handle_query", bot.handle_query, corpus),
+        ("handle_query_uncached", cold_handle_query, corpus),
+        ("__extract_time", bot._TechnovateBot__extract_time, lowered),
+        ("__find_best_match", lambda query: find_best_match(state, query), lowered),
+        ("show_schedule", bot.show_schedule, days),
+    ]
+
+
+def git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(size, seed, rounds):
+    corpus = build_corpus(size, seed)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "revision": git_revision(),
+            "seed": seed,
+            "corpus_size": len(corpus),
+            "distinct_queries": len(set(corpus)),
+            "rounds": rounds,
+        },
+        "results": {},
+    }
+    for variant, factory in VARIANTS:
+        bot = factory()
+        for name, func, inputs in targets(bot, corpus):
+            # show_schedule has only a handful of inputs; repeat it so its percentiles mean something
+            repeat = rounds * max(1, len(corpus) // len(inputs)) if len(inputs) < 50 else rounds
+            result = latency(func, inputs, repeat)
+            result.update(allocations(func, inputs))
+            report["results"][f"{variant}.{name}"] = result
+        close = getattr(bot, "close", None)
+        if close:
+            close()
+    return report
+
+
+def compare(report, baseline):
+    """Print p50/p99 change against an earlier report."""
+    print(f"{'target':<52}{'p50 before':>12}{'p50 after':>12}{'p99 before':>12}{'p99 after':>12}",
+          file=sys.stderr)
+    for name, after in report["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            continue
+        print(f"{name:<52}{before['p50_us']:>12.2f}{after['p50_us']:>12.2f}"
+              f"{before['p99_us']:>12.2f}{after['p99_us']:>12.2f}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=2000, help="synthetic corpus size")
+    parser.add_argument("--seed", type=int, default=2025)
+    parser.add_argument("--rounds", type=int, default=3, help="timed passes over the corpus")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="earlier JSON report to compare against (table on stderr)")
+    args = parser.parse_args()
+
+    report = run(args.size, args.seed, args.rounds)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline:
+            compare(report, json.load(baseline))
+
+
+if __name__ == "__main__":
+    main()
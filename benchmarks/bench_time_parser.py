@@ -0,0 +1,77 @@
+"""Microbenchmark: time_parser.extract_time vs the per-bot extractors it replaced.
+
+Run from the repository root:  python benchmarks/bench_time_parser.py
+"""
+import os
+import re
+import sys
+import timeit
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from time_parser import extract_time, extract_times  # noqa: E402
+
+
+# ----------------- Previous Implementations -----------------
+def strptime_extract_time(text):
+    """main.py / speaking.py / gui.py before the shared parser."""
+    text = text.replace("pm", " PM").replace("am", " AM")
+    for word in text.split():
+        try:
+            return datetime.strptime(word, "%I%p").strftime("%H:00")
+        except:
+            pass
+        try:
+            return datetime.strptime(word, "%I:%M%p").strftime("%H:%M")
+        except:
+            pass
+    return None
+
+
+def regex_extract_time(text):
+    """new_gui_probab.py / gui_probab_speech.py before the shared parser."""
+    text = text.replace("pm", " PM").replace("am", " AM")
+    time_patterns = [r'(\d{1,2}):(\d{2})\s*PM', r'(\d{1,2}):(\d{2})\s*AM', r'(\d{1,2})\s*PM', r'(\d{1,2})\s*AM']
+    for pattern in time_patterns:
+        match = re.search(pattern, text)
+        if match:
+            hour = int(match.group(1))
+            minute = int(match.group(2)) if len(match.groups()) > 1 else 0
+            if "PM" in text and hour != 12:
+                hour += 12
+            return f"{hour:02d}:{minute:02d}"
+    return None
+
+
+QUERIES = [
+    "what's on day 2 at 3pm",
+    "events at 4:30 pm on day 3",
+    "day 1 schedule",
+    "is there anything happening on day 2 around half past four in the evening near the auditorium",
+    "schedule for day 1 at 6 pm",
+    "day 3 at noon",
+    "tell me about technovate and how to register for the hackathon and the coding speedrun",
+    "day 2 15:00",
+]
+
+
+def bench(name, func, number):
+    seconds = timeit.timeit(lambda: [func(q) for q in QUERIES], number=number)
+    per_call = seconds / (number * len(QUERIES)) * 1e6
+    print(f"{name:<28}{per_call:>10.2f} us/query")
+    return per_call
+
+
+if __name__ == "__main__":
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{len(QUERIES)} queries x {number} rounds\n")
+    baseline = bench("strptime (main.py)", strptime_extract_time, number)
+    bench("regex x4 (new_gui_probab)", regex_extract_time, number)
+    shared = bench("time_parser.extract_time", extract_time, number)
+    seconds = timeit.timeit(lambda: extract_times(QUERIES), number=number)
+    print(f"{'time_parser.extract_times':<28}{seconds / (number * len(QUERIES)) * 1e6:>10.2f} us/query (batch)")
+    print(f"\nspeed-up over strptime: {baseline / shared:.1f}x")
+    print("\nsample results (strptime / regex / shared):")
+    for query in QUERIES:
+        print(f"  {query[:48]:<50}{strptime_extract_time(query)!s:<7}{regex_extract_time(query)!s:<7}{extract_time(query)}")
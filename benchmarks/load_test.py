@@ -0,0 +1,119 @@
+"""Local load generator for server.py.
+
+Opens --concurrency keep-alive connections (HTTP or WebSocket) and fires
+festival questions for --duration seconds, then reports throughput and
+latency percentiles. Without --url it starts an in-process server first.
+
+    python benchmarks/load_test.py --concurrency 50 --duration 10
+    python benchmarks/load_test.py --url http://127.0.0.1:8080 --ws
+"""
+import argparse
+import asyncio
+import base64
+import itertools
+import json
+import os
+import sys
+import time
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from server import BotServer, encode_frame, load_bot, read_frame  # noqa: E402
+
+QUERIES = [
+    "what's on day 2 at 3pm", "day 1 schedule", "how to register", "food",
+    "accommodation", "events at 4:30 pm on day 3", "theme for 2025", "hackathn",
+    "contact", "day 3 at 8 pm", "celebrity guests", "what is technovate",
+]
+
+
+def percentile(samples, fraction):
+    index = min(len(samples) - 1, int(round(fraction * (len(samples) - 1))))
+    return samples[index]
+
+
+async def http_client(host, port, deadline, latencies, queries):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            body = json.dumps({"query": next(queries)}).encode()
+            started = time.perf_counter()
+            writer.write(f"POST /query HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+                         f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.decode("latin-1").split("\r\n"):
+                if line.lower().startswith("content-length:"):
+                    length = int(line.split(":", 1)[1])
+            await reader.readexactly(length)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        writer.close()
+
+
+async def ws_client(host, port, deadline, latencies, queries):
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write((f"GET /ws HTTP/1.1\r\nHost: {host}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                  f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode())
+    await writer.drain()
+    await reader.readuntil(b"\r\n\r\n")
+    try:
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            writer.write(encode_frame(0x1, next(queries).encode(), mask=os.urandom(4)))
+            await writer.drain()
+            await read_frame(reader)
+            latencies.append(time.perf_counter() - started)
+        writer.write(encode_frame(0x8, b"\x03\xe8", mask=os.urandom(4)))
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def run(args):
+    server = None
+    if args.url:
+        url = urlparse(args.url)
+        host, port = url.hostname, url.port or 80
+    else:
+        server = await BotServer(load_bot(args.bot), "127.0.0.1", 0).start()
+        host, port = server.host, server.port
+
+    client = ws_client if args.ws else http_client
+    latencies = []
+    queries = itertools.cycle(QUERIES)
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(client(host, port, deadline, latencies, queries) for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    if server is not None:
+        await server.close()
+
+    latencies.sort()
+    report = {
+        "transport": "websocket" if args.ws else "http",
+        "concurrency": args.concurrency,
+        "requests": len(latencies),
+        "seconds": round(elapsed, 3),
+        "requests_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3) if latencies else None,
+    }
+    print(json.dumps(report, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the bot server")
+    parser.add_argument("--url", help="existing server, e.g. http://127.0.0.1:8080 (default: start one in-process)")
+    parser.add_argument("--bot", default="bot_core:TechnovateBot")
+    parser.add_argument("--ws", action="store_true", help="use WebSocket instead of HTTP POST")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=5.0)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
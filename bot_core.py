@@ -0,0 +1,488 @@
+"""The one Technovate bot engine every front-end talks to.
+
+    from bot_core import TechnovateBot
+    reply = TechnovateBot().answer("what's on day 2 at 3 pm")
+    reply.text, reply.speech, reply.intent, reply.events
+
+Nothing here imports Tk or a speech driver: main.py (console),
+speaking.py (console + voice), gui.py / new_gui_probab.py (Tk) and
+gui_probab_speech.py (Tk + voice) are thin adapters that only decide where
+reply.text and reply.speech go.
+"""
+import hashlib
+import re
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from time_parser import TIME_WORDS, extract_time, extract_times, extract_range
+from intent_index import IntentIndex
+from fuzzy_match import FuzzyMatcher
+from intent_ranker import STOPWORDS, IntentRanker
+from entity_index import EntityIndex, normalize
+from spelling import SpellingCorrector
+from schedule_store import NO_VENUE, ScheduleStore, ScheduleRenderer, speakable, spoken_minutes, to_minutes
+from festival_data import DataSource, DEFAULT_PATH
+from response_cache import ResponseCache
+from instrumentation import timed
+
+# Below this confidence the ranker's pick is not trusted and the keyword
+# matchers decide; intents ranked this close together are a tie that goes to
+# the one listed first
+MIN_RANK_CONFIDENCE = 0.15
+MIN_RANK_MARGIN = 0.04
+# An event or venue in the query is looked up in the schedule's indexes only
+# when the query asks about it ("when is cricket", "what's at the auditorium")
+WHEN_WHERE_CUES = ("when", "where", "what time", "timing", "which day", "venue", "location")
+VENUE_CUES = WHEN_WHERE_CUES + ("happening", "going on", "what's on", "whats on", "what is on", "what's at",
+                                "whats at", "what is at", "what's in", "whats in", "what is in")
+_WHEN_WHERE_CUE_RE = re.compile("|".join(map(re.escape, WHEN_WHERE_CUES)))
+_VENUE_CUE_RE = re.compile("|".join(map(re.escape, VENUE_CUES)))
+_WORD_RE = re.compile(r"[a-z]+")
+NOT_UNDERSTOOD = "Bot: Hmm, I didn't catch that. Try asking like 'What's on Day 2 at 3 PM?' or type 'help'."
+
+
+# ----------------- Abstract Base Class -----------------
+class FestivalBot(ABC):
+    @abstractmethod
+    def greet(self): pass
+
+    @abstractmethod
+    def handle_query(self, query): pass
+
+    @abstractmethod
+    def show_schedule(self, day): pass
+
+
+# ----------------- Structured Reply -----------------
+class Reply:
+    """What the bot concluded, in a form every front-end can use.
+
+    intent: the FAQ intent, or one of "schedule", "event_at", "running",
+            "next", "range", "event", "venue", "no_events", "no_day", "unknown"
+    text:   the reply for the screen
+    speech: the same reply phrased for text-to-speech
+    day, time, events: the schedule lookup behind the reply, if any
+    """
+
+    __slots__ = ("intent", "text", "speech", "day", "time", "events")
+
+    def __init__(self, intent, text, speech=None, day=None, time=None, events=()):
+        self.intent = intent
+        self.text = text
+        self.speech = speech if speech is not None else spoken(text)
+        self.day = day
+        self.time = time
+        self.events = list(events)
+
+    def __repr__(self):
+        return f"Reply({self.intent!r}, day={self.day!r}, time={self.time!r}, events={len(self.events)})"
+
+
+def _is_day_query(query):
+    """True for queries the day/time path answers ("day 2 at 3 pm")."""
+    return "day" in query and any(char.isdigit() for char in query)
+
+
+def _day_position(days, day):
+    return days.index(day) if day in days else len(days)
+
+
+def spoken(text):
+    """Display text -> TTS text: no "Bot:" label, emoji or bullet dashes; one sentence per line."""
+    sentences = []
+    for line in text.replace("Bot:", "", 1).splitlines():
+        line = speakable(line.lstrip("- "))
+        if line:
+            sentences.append(line if line[-1] in ".!?:," else line + ".")
+    return " ".join(sentences)
+
+
+def _say(time):
+    """'16:30' -> '4:30 PM'"""
+    return spoken_minutes(to_minutes(time))
+
+
+# ----------------- Shared Matchers -----------------
+class Matchers:
+    """The keyword structures compiled from one FAQ list.
+
+    Compiled once per distinct FAQ content and shared by every bot whose
+    data has the same FAQ (festivals of one organiser, campuses of one
+    event); dropped once no bot uses them.
+    """
+
+    __slots__ = ("key", "phrases", "ranker", "index", "fuzzy", "__weakref__")
+
+    def __init__(self, key, faq):
+        keyword_entries = [(keyword, intent) for intent, _, keywords, _ in faq for keyword in keywords]
+        self.key = key
+        self.phrases = {}  # a command phrase typed as it is -> its intent (first listed wins)
+        for intent, phrase, _, _ in faq:
+            self.phrases.setdefault(" ".join(phrase.lower().split()), intent)
+        self.ranker = IntentRanker(faq)
+        self.index = IntentIndex(keyword_entries)
+        self.fuzzy = FuzzyMatcher(keyword_entries, threshold=0.6)
+
+
+_matchers = weakref.WeakValueDictionary()  # FAQ content hash -> Matchers
+_matchers_lock = threading.Lock()
+
+
+def shared_matchers(faq):
+    """The Matchers for this FAQ list, reusing a live copy compiled from identical content."""
+    key = hashlib.sha1(repr(faq).encode("utf-8", "surrogatepass")).hexdigest()
+    with _matchers_lock:
+        matchers = _matchers.get(key)
+        if matchers is None:
+            matchers = _matchers[key] = Matchers(key, faq)
+        return matchers
+
+
+def build_speller(faq, answers, store):
+    """A SpellingCorrector over the words the bot can act on: keywords, event names, venues.
+
+    Words of the answers, the cue phrases and times are known as well, so
+    they are never "corrected", but no query word is turned into one.
+    """
+    catalog = store.catalog
+    texts = [text for _, phrase, keywords, _ in faq for text in [phrase] + list(keywords)]
+    texts.extend(catalog.names[name_id] for name_id in store.event_ids())
+    texts.extend(catalog.venues[venue_id] for venue_id in store.venue_ids())
+    known = list(STOPWORDS) + list(TIME_WORDS) + list(VENUE_CUES) + list(store.days()) + list(answers.values())
+    return SpellingCorrector(_WORD_RE.findall(" ".join(texts).lower()),
+                             known=_WORD_RE.findall(" ".join(known).lower()))
+
+
+# ----------------- Published Bot State -----------------
+class BotState:
+    """Everything a query reads, built from one FestivalData and never changed afterwards.
+
+    A reload builds the next BotState next to the live one and publishes it
+    with a single assignment; a query takes the current state once and uses
+    it throughout, so it never sees half of an update.
+    """
+
+    __slots__ = ("version", "festival", "schedule", "listings", "entities", "speller", "matchers", "answers")
+
+    def __init__(self, data, previous=None):
+        if previous is None:
+            self.version = 1
+            self.schedule = ScheduleStore.from_dict(data.schedule)
+            # Day listings are rendered once per day and rebuilt only when that day changes
+            self.listings = ScheduleRenderer(self.schedule, header="\n🗓️ Schedule for {day}:\n",
+                                             line="🕒 {time} – {event}", trailer="\n")
+        else:
+            # Only the days whose slots changed are rebuilt (and re-rendered)
+            self.version = previous.version + 1
+            self.schedule = previous.schedule.updated(data.schedule)
+            self.listings = previous.listings.rebound(self.schedule)
+        self.festival = data.festival or "Technovate"
+        # Event / venue names to spot in queries, from this schedule
+        self.entities = EntityIndex(self.schedule)
+        # Misspelled query words are mapped back onto this vocabulary first
+        self.speller = build_speller(data.faq, data.answers, self.schedule)
+        # Keyword matchers are compiled once per distinct FAQ (and shared with
+        # any other bot using the same one)
+        self.matchers = shared_matchers(data.faq)
+        self.answers = data.answers
+
+
+# ----------------- Derived Class: TechnovateBot -----------------
+class TechnovateBot(FestivalBot):
+    def __init__(self, data_path=DEFAULT_PATH, hot_reload=False):
+        # Schedule, theme and FAQ answers come from the data file; with hot_reload
+        # the file is polled and edits go live without a restart
+        self.__source = DataSource(data_path)
+        # Popular questions are answered from here; cleared whenever the data changes
+        self.response_cache = ResponseCache(max_size=256)
+        self.__state = BotState(self.__source.data)
+        self.__source.subscribe(self.__apply)
+        if hot_reload:
+            self.__source.watch()
+
+    def __apply(self, data):
+        # Built in full before the one assignment that publishes it; if building
+        # fails the previous state stays live
+        self.__state = BotState(data, self.__state)
+
+    def close(self):
+        self.__source.close()
+
+    @property
+    def matchers(self):
+        """The (possibly shared) Matchers this bot currently answers with."""
+        return self.__state.matchers
+
+    @property
+    def festival(self):
+        return self.__state.festival
+
+    def greet(self):
+        return f"\n🎉 Welcome to {self.festival} Bot! Ask me anything about the event schedule, day-wise or time-wise."
+
+    def farewell(self):
+        return f"Bot: Goodbye! Enjoy {self.festival} 🌟"
+
+    def known_speech(self):
+        """Every reply spoken word for word, whatever the query: for prewarming an audio cache."""
+        state = self.__state
+        texts = [spoken(self.greet()), spoken(self.farewell()), spoken(NOT_UNDERSTOOD)]
+        texts.extend(spoken(answer) for answer in state.answers.values())
+        texts.extend(state.listings.speech(day) for day in state.schedule.days())
+        return list(dict.fromkeys(text for text in texts if text))
+
+    # ------------------- Answering -------------------
+    @timed("handle_query")  # handle_query() and every front-end come through here
+    def answer(self, query):
+        """The Reply for one query (cached)."""
+        state = self.__state
+        return self.response_cache.get_or_compute(query, lambda key: self.__answer(state, key), state.version)
+
+    def handle_query(self, query):
+        return self.answer(query).text
+
+    def __answer(self, state, query):
+        query = state.speller.correct(query)
+        reply = self.__entity_reply(state, query)
+        if reply is not None:
+            return reply
+        if _is_day_query(query):
+            return self.__handle_day_time_query(state, query)
+        return self.__faq_reply(state, self.__find_best_match(state, query))
+
+    def answer_many(self, queries):
+        """Replies for a whole batch (list, tuple, NumPy array...), in order."""
+        normalized = [ResponseCache.normalize(str(query)) for query in queries]  # as answer() keys its cache
+        unique = list(dict.fromkeys(normalized))  # replayed logs repeat a lot; answer each once
+        state = self.__state
+        corrected = {query: state.speller.correct(query) for query in unique}
+
+        day_queries = [q for q in corrected.values() if _is_day_query(q)]
+        times = dict(zip(day_queries, self.__extract_times(day_queries)))
+
+        replies = {}
+        for original in unique:
+            query = corrected[original]
+            reply = self.__entity_reply(state, query)
+            if reply is not None:
+                replies[original] = reply
+                continue
+            if query in times:
+                replies[original] = self.__day_time_response(state, query, times[query])
+                continue
+            replies[original] = self.__faq_reply(state, self.__find_best_match(state, query))
+        return [replies[query] for query in normalized]
+
+    def handle_queries(self, queries):
+        """Answer a whole batch and return a parallel list of response texts."""
+        return [reply.text for reply in self.answer_many(queries)]
+
+    def rank_intents(self, query, limit=3):
+        """[(intent, confidence)] for a FAQ-style query, best first."""
+        return self.__state.matchers.ranker.rank(" ".join(str(query).lower().split()), limit)
+
+    @timed("match")
+    def __find_best_match(self, state, query):
+        # A command phrase typed as it is answers directly. Otherwise the BM25
+        # ranker weighs every keyword the query hits; when it is unsure
+        # a keyword appearing verbatim wins (earliest command first), and
+        # a query hitting no keyword at all (off-topic, or misspelled beyond
+        # the speller) only gets the closest fuzzy keyword above 0.6
+        matchers = state.matchers
+        intent = matchers.phrases.get(query.strip(" ?!."))
+        if intent is not None:
+            return intent
+        ranked = matchers.ranker.rank(query)
+        if not ranked:
+            return matchers.fuzzy.best_match(query)
+        intent = matchers.ranker.best(ranked, MIN_RANK_CONFIDENCE, MIN_RANK_MARGIN)
+        if intent is not None:
+            return intent
+        intent = matchers.index.first_match(query)
+        if intent is not None:
+            return intent
+        return matchers.fuzzy.best_match(query)
+
+    def __faq_answer(self, intent):
+        answer = self.__state.answers.get(intent) if intent else None
+        return NOT_UNDERSTOOD if answer is None else answer
+
+    def __faq_reply(self, state, intent):
+        answer = state.answers.get(intent) if intent else None
+        if answer is None:
+            return Reply("unknown", NOT_UNDERSTOOD)
+        return Reply(intent, answer)
+
+    # ------------------- Schedule -------------------
+    def show_schedule(self, day):
+        return self.__schedule_reply(self.__state, day).text
+
+    def __schedule_reply(self, state, day, intent="schedule", lead="", lead_speech=""):
+        # lead: an explanation shown above the full listing ("nothing else after 8 PM...")
+        listing = state.listings.text(day)
+        if not listing:
+            return Reply("no_events", "Bot: Sorry, I don't have events listed for that day.", day=day)
+        speech = state.listings.speech(day)
+        if lead_speech:
+            speech = lead_speech + " " + speech
+        return Reply(intent, lead + listing, speech, day=day,
+                     events=state.schedule.day(day).entries if intent == "schedule" else ())
+
+    def __handle_day_time_query(self, state, query):
+        return self.__day_time_response(state, query, self.__extract_time(query))
+
+    def __day_time_response(self, state, query, time):
+        days = state.schedule.days()
+        day = ""
+        for d in days:
+            if d in query:
+                day = d
+                break
+        if not day:
+            return Reply("no_day", f"Bot: Please mention a valid day ({', '.join(d.title() for d in days)}).")
+        time_range = extract_range(query)
+        if time_range:
+            return self.__range_response(state, day, *time_range)
+        if not time:
+            return self.__schedule_reply(state, day)
+        if "next" in query or "after" in query:
+            return self.__next_response(state, day, time)
+        found = state.schedule.day(day).starting_at(to_minutes(time))
+        if found:
+            event = ", ".join(entry.text for entry in found)
+            return Reply("event_at", f"Bot: At {time} on {day.title()}, you'll find:\n👉 {event}",
+                         f"At {_say(time)} on {day.title()}, you'll find {speakable(event)}.",
+                         day=day, time=time, events=found)
+        running = state.schedule.at(day, time)
+        if running:
+            return Reply("running", f"Bot: At {time} on {day.title()}, this is going on:\n"
+                         + "\n".join(f"👉 {entry.text} (started {entry.time})" for entry in running),
+                         f"At {_say(time)} on {day.title()}, this is going on: "
+                         + " ".join(f"{speakable(entry.text)}, which started at {_say(entry.time)}."
+                                    for entry in running),
+                         day=day, time=time, events=running)
+        return self.__next_response(state, day, time)
+
+    def __next_response(self, state, day, time):
+        upcoming = state.schedule.next_after(day, time)
+        if upcoming:
+            return Reply("next", f"Bot: Next up on {day.title()} after {time} is at {upcoming[0].time}:\n"
+                         + "\n".join(f"👉 {entry.text}" for entry in upcoming),
+                         f"Next up on {day.title()} after {_say(time)} is at {_say(upcoming[0].time)}: "
+                         + ", ".join(speakable(entry.text) for entry in upcoming) + ".",
+                         day=day, time=time, events=upcoming)
+        reply = self.__schedule_reply(
+            state, day, "next",
+            f"Bot: Hmm, nothing else on {day.title()} after {time}. Here's what we have that day:\n",
+            f"Hmm, nothing else on {day.title()} after {_say(time)}.")
+        reply.time = time
+        return reply
+
+    def __range_response(self, state, day, start, end):
+        events = state.schedule.between(day, start, end)
+        if not events:
+            reply = self.__schedule_reply(
+                state, day, "range",
+                f"Bot: Hmm, nothing starts between {start} and {end} on {day.title()}. Here's what we have that day:\n",
+                f"Hmm, nothing starts between {_say(start)} and {_say(end)} on {day.title()}.")
+            reply.time = start
+            return reply
+        return Reply("range", f"Bot: Between {start} and {end} on {day.title()}:\n"
+                     + "\n".join(f"🕒 {entry.time} – {entry.text}" for entry in events),
+                     f"Between {_say(start)} and {_say(end)} on {day.title()}: "
+                     + " ".join(f"At {_say(entry.time)}, {speakable(entry.text)}." for entry in events),
+                     day=day, time=start, events=events)
+
+    # ------------------- Events and Venues -------------------
+    def __entity_reply(self, state, query):
+        """"When/where is <event>" or "what's at <venue>", answered from the inverted indexes; else None."""
+        # Cue words first: most queries name no event and skip the lookup
+        if _VENUE_CUE_RE.search(query):
+            found = state.entities.find(query)
+            if found is not None and found[0] == "event" and not _WHEN_WHERE_CUE_RE.search(query):
+                found = None
+        else:
+            found = state.entities.exact(query)
+        if found is None:
+            return None
+        if _is_day_query(query) and (extract_range(query) or self.__extract_time(query)):
+            return None  # "day 2 at 3 pm at the auditorium" asks for a time, not the venue's listing
+        kind, ids, label = found
+        if state.matchers.ranker.rank(normalize(query).replace(normalize(label), " "), 1):
+            return None  # "where do i register for cricket" asks an FAQ, whatever it names besides
+        schedule = state.schedule
+        slots = schedule.event_slots if kind == "event" else schedule.venue_slots
+        days = schedule.days()
+        found_slots = sorted({(day, entry.index): (day, entry) for item in ids for day, entry in slots(item)}.items(),
+                             key=lambda item: (_day_position(days, item[0][0]), item[1][1].start))
+        found_slots = [slot for _, slot in found_slots]
+        day = next((d for d in days if d in query), None)
+        lead = lead_speech = ""
+        if day is not None:
+            on_day = [(d, entry) for d, entry in found_slots if d == day]
+            if on_day:
+                found_slots = on_day
+            else:
+                lead = f"Bot: Nothing with {label} on {day.title()}.\n"
+                lead_speech = f"Nothing with {speakable(label)} on {day.title()}."
+                day = None
+        if kind == "event":
+            return self.__event_reply(schedule.catalog, label, set(ids), found_slots, day, lead, lead_speech)
+        return self.__venue_reply(schedule.catalog, label, ids[0], found_slots, day, lead, lead_speech)
+
+    def __event_reply(self, catalog, label, name_ids, slots, day, lead, lead_speech):
+        lines, spoken_parts = [], []
+        for slot_day, entry in slots:
+            events = [(name, venue) for name, venue in entry.schedule.events(entry.index) if name in name_ids]
+            what = ", ".join(catalog.render(name, venue) for name, venue in events)
+            lines.append(f"👉 {slot_day.title()}, {entry.time}: {what}")
+            for name, venue in events:
+                # "Day 1 at 4:30 PM at Ground near BALCO"; the event is named only if it isn't the label
+                said = f"{slot_day.title()} at {_say(entry.time)}"
+                if catalog.names[name] != label:
+                    said += f", {speakable(catalog.names[name])}"
+                if venue != NO_VENUE:
+                    said += f" at {speakable(catalog.venues[venue])}"
+                spoken_parts.append(said)
+        header = "Bot: " if not lead else ""
+        return Reply("event", lead + f"{header}Here's when and where {label} is on:\n" + "\n".join(lines),
+                     " ".join(filter(None, (lead_speech, f"{speakable(label)} is on "
+                                            + "; ".join(spoken_parts) + "."))),
+                     day=day, events=[entry for _, entry in slots])
+
+    def __venue_reply(self, catalog, label, venue_id, slots, day, lead, lead_speech):
+        lines, spoken_parts = [], []
+        for slot_day, entry in slots:
+            what = ", ".join(catalog.names[name] for name, venue in entry.schedule.events(entry.index)
+                             if venue == venue_id)
+            lines.append(f"🕒 {slot_day.title()}, {entry.time} – {what}")
+            spoken_parts.append(f"On {slot_day.title()} at {_say(entry.time)}, {speakable(what)}.")
+        header = "Bot: " if not lead else ""
+        return Reply("venue", lead + f"{header}Here's what's happening at {label}:\n" + "\n".join(lines),
+                     " ".join(filter(None, (lead_speech, f"Here's what's happening at {speakable(label)}.",
+                                            *spoken_parts))),
+                     day=day, events=[entry for _, entry in slots])
+
+    @timed("extract_time")
+    def __extract_time(self, text):
+        return extract_time(text)
+
+    def __extract_times(self, texts):
+        return extract_times(texts)
+
+    # FAQ Methods (answers come from the data file)
+    def about_technovate(self): return self.__faq_answer("about_technovate")
+    def theme(self): return self.__faq_answer("theme")
+    def team_requirement(self): return self.__faq_answer("team_requirement")
+    def tech_events(self): return self.__faq_answer("tech_events")
+    def cultural_events(self): return self.__faq_answer("cultural_events")
+    def open_stage(self): return self.__faq_answer("open_stage")
+    def external_participation(self): return self.__faq_answer("external_participation")
+    def registration_info(self): return self.__faq_answer("registration_info")
+    def event_registration(self): return self.__faq_answer("event_registration")
+    def accommodation_info(self): return self.__faq_answer("accommodation_info")
+    def food_info(self): return self.__faq_answer("food_info")
+    def contact_info(self): return self.__faq_answer("contact_info")
+    def previous_theme(self): return self.__faq_answer("previous_theme")
+    def celeb_guests(self): return self.__faq_answer("celeb_guests")
+    def past_sponsors(self): return self.__faq_answer("past_sponsors")
@@ -0,0 +1,252 @@
+"""Many festival bots in one process.
+
+    registry = BotRegistry.from_directory("festivals/")   # one data file per tenant
+    registry.answer("technovate", "what's on day 2 at 3 pm")
+
+A tenant is a name and a data file. Its bot is built on first use, kept
+while it is used, and the least recently used bots are closed once the
+estimated memory of all loaded bots passes memory_budget. Bots whose FAQ
+lists are identical share one compiled set of matchers (see
+bot_core.shared_matchers), so that part is counted once. A bot is built
+outside the registry lock, so a cold tenant never stalls the others, and
+its size is re-measured every remeasure_every queries on a background
+thread, so a growing response cache counts against the budget too
+without the query that triggers it paying for the walk.
+"""
+import gc
+import os
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+
+from bot_core import TechnovateBot
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+DEFAULT_REMEASURE_EVERY = 256
+
+# Code and infrastructure reachable from a bot, not owned by it
+_NOT_OWNED = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+              types.CodeType, threading.Thread)
+
+
+def deep_size(root, seen):
+    """Approximate bytes reachable from root, skipping ids in seen (which is updated)."""
+    total = 0
+    pending = [root]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, _NOT_OWNED):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj, 0)
+        pending.extend(gc.get_referents(obj))
+    return total
+
+
+# ----------------- Tenant -----------------
+class Tenant:
+    __slots__ = ("name", "data_path", "bot", "size", "matchers_key", "loads", "queries", "last_used", "loading",
+                 "measuring")
+
+    def __init__(self, name, data_path):
+        self.name = name
+        self.data_path = data_path
+        self.loading = threading.Lock()  # one load of this tenant at a time
+        self.bot = None
+        self.size = 0        # estimated bytes owned by this bot alone
+        self.matchers_key = None  # the shared matchers it was counted against
+        self.loads = 0
+        self.queries = 0
+        self.last_used = None
+        self.measuring = False  # a re-measure is running on a background thread
+
+
+# ----------------- Bot Registry -----------------
+class BotRegistry:
+    """Hosts one FestivalBot per tenant, loaded lazily and evicted LRU under a memory budget.
+
+    factory(data_path) builds a tenant's bot (TechnovateBot by default);
+    bots with a close() method are closed on eviction.
+    """
+
+    def __init__(self, tenants=None, memory_budget=DEFAULT_MEMORY_BUDGET, factory=TechnovateBot,
+                 remeasure_every=DEFAULT_REMEASURE_EVERY):
+        self.memory_budget = memory_budget
+        self.remeasure_every = remeasure_every
+        self.__factory = factory
+        self.__tenants = {}
+        self.__loaded = OrderedDict()  # name -> Tenant, least recently used first
+        self.__shared = {}             # matchers key -> (estimated bytes, number of loaded bots using it)
+        self.__lock = threading.RLock()
+        self.evictions = 0
+        for name, data_path in (tenants or {}).items():
+            self.register(name, data_path)
+
+    @classmethod
+    def from_directory(cls, directory, **options):
+        """One tenant per *.json file in directory, named after the file."""
+        tenants = {name[:-5]: os.path.join(directory, name)
+                   for name in sorted(os.listdir(directory)) if name.endswith(".json")}
+        return cls(tenants, **options)
+
+    # ------------------- Tenants -------------------
+    def register(self, name, data_path):
+        with self.__lock:
+            if name in self.__tenants:
+                self.evict(name)
+            self.__tenants[name] = Tenant(name, data_path)
+
+    def unregister(self, name):
+        with self.__lock:
+            self.evict(name)
+            del self.__tenants[name]
+
+    def tenants(self):
+        return sorted(self.__tenants)
+
+    def loaded(self):
+        """Names of the tenants whose bots are in memory, least recently used first."""
+        with self.__lock:
+            return list(self.__loaded)
+
+    def is_loaded(self, name):
+        """True if the tenant's bot is in memory, so get() returns without building it."""
+        tenant = self.__tenants.get(name)
+        return tenant is not None and tenant.bot is not None
+
+    def __contains__(self, name):
+        return name in self.__tenants
+
+    # ------------------- Answering -------------------
+    def get(self, name):
+        """The tenant's bot, loading it (and evicting others) if needed; KeyError for unknown tenants."""
+        with self.__lock:
+            tenant = self.__tenants[name]
+            tenant.last_used = time.monotonic()
+            tenant.queries += 1
+            bot = tenant.bot
+            if bot is not None:
+                self.__loaded.move_to_end(name)
+                if self.remeasure_every and not tenant.queries % self.remeasure_every and not tenant.measuring:
+                    # Walking the bot takes milliseconds; don't make this query (or an event loop) wait for it
+                    tenant.measuring = True
+                    threading.Thread(target=self.__remeasure, args=(tenant, bot), name="bot-remeasure",
+                                     daemon=True).start()
+                return bot
+        with tenant.loading:
+            with self.__lock:
+                if tenant.bot is not None:  # another thread loaded it meanwhile
+                    self.__loaded.move_to_end(name)
+                    return tenant.bot
+            return self.__load(tenant)
+
+    def answer(self, name, query):
+        return self.get(name).answer(query)
+
+    def handle_query(self, name, query):
+        return self.get(name).handle_query(query)
+
+    # ------------------- Memory -------------------
+    def memory_usage(self):
+        """Estimated bytes held by loaded bots, shared matchers counted once."""
+        with self.__lock:
+            return (sum(tenant.size for tenant in self.__loaded.values())
+                    + sum(size for size, _ in self.__shared.values()))
+
+    def evict(self, name):
+        """Close and forget a tenant's bot; it is rebuilt on next use."""
+        with self.__lock:
+            tenant = self.__loaded.pop(name, None)
+            if tenant is None:
+                return False
+            bot, tenant.bot, tenant.size = tenant.bot, None, 0
+            key, tenant.matchers_key = tenant.matchers_key, None
+            if key is not None:
+                size, users = self.__shared[key]
+                if users > 1:
+                    self.__shared[key] = (size, users - 1)
+                else:
+                    del self.__shared[key]
+            close = getattr(bot, "close", None)
+            if close:
+                close()
+            self.evictions += 1
+            return True
+
+    def close(self):
+        with self.__lock:
+            for name in list(self.__loaded):
+                self.evict(name)
+
+    def stats(self):
+        with self.__lock:
+            return {
+                "tenants": len(self.__tenants),
+                "loaded": len(self.__loaded),
+                "shared_matcher_sets": len(self.__shared),
+                "memory_bytes": self.memory_usage(),
+                "memory_budget": self.memory_budget,
+                "evictions": self.evictions,
+                "per_tenant": {tenant.name: {"loaded": tenant.bot is not None, "bytes": tenant.size,
+                                             "loads": tenant.loads, "queries": tenant.queries}
+                               for tenant in self.__tenants.values()},
+            }
+
+    def __load(self, tenant):
+        # Built and measured outside the registry lock; only the bookkeeping takes it
+        bot = self.__factory(tenant.data_path)
+        matchers = getattr(bot, "matchers", None)
+        seen = set()
+        matchers_size = None
+        if matchers is not None:
+            with self.__lock:
+                measured = matchers.key in self.__shared
+            # Shared matchers are measured once, when the first bot using them loads;
+            # everything else reachable from the bot is this tenant's own
+            if measured:
+                seen.add(id(matchers))
+            else:
+                matchers_size = deep_size(matchers, seen)
+        size = deep_size(bot, seen)
+        with self.__lock:
+            if self.__tenants.get(tenant.name) is not tenant:  # unregistered while loading
+                close = getattr(bot, "close", None)
+                if close:
+                    close()
+                raise KeyError(tenant.name)
+            if matchers is not None:
+                shared_size, users = self.__shared.get(matchers.key, (matchers_size, 0))
+                if shared_size is None:  # its other users were evicted while this one loaded
+                    shared_size = deep_size(matchers, set())
+                self.__shared[matchers.key] = (shared_size, users + 1)
+                tenant.matchers_key = matchers.key
+            tenant.size = size
+            tenant.bot = bot
+            tenant.loads += 1
+            self.__loaded[tenant.name] = tenant
+            self.__enforce_budget(keep=tenant.name)
+        return bot
+
+    def __remeasure(self, tenant, bot):
+        """Re-estimate a loaded bot (its response cache grows with use) and evict others if it outgrew the budget."""
+        try:
+            matchers = getattr(bot, "matchers", None)
+            seen = {id(matchers)} if matchers is not None else set()
+            size = deep_size(bot, seen)
+            with self.__lock:
+                if tenant.bot is bot:
+                    tenant.size = size
+                    self.__enforce_budget(keep=tenant.name)
+        finally:
+            with self.__lock:
+                tenant.measuring = False
+
+    def __enforce_budget(self, keep):
+        while self.memory_usage() > self.memory_budget and len(self.__loaded) > 1:
+            oldest = next(iter(self.__loaded))
+            if oldest == keep:
+                self.__loaded.move_to_end(keep)
+                continue
+            self.evict(oldest)
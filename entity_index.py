@@ -0,0 +1,81 @@
+import re
+
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_SUBTITLE = re.compile(r"\s+[–—-]\s+")
+MIN_ALIAS_LENGTH = 3
+
+
+def normalize(text):
+    """'Where is Quiz-Runner?' -> ' where is quiz runner ' (padded, so phrases match whole words)."""
+    return " " + _NON_WORD.sub(" ", text.lower()).strip() + " "
+
+
+def aliases(name):
+    """The ways a query may name an event: 'Fiducia – Final Round' -> itself and 'Fiducia'."""
+    names = [name]
+    short = _SUBTITLE.split(name, 1)[0]
+    if short != name:
+        names.append(short)
+    return names
+
+
+# ----------------- Event / Venue Spotting -----------------
+class EntityIndex:
+    """Spots the schedule's event names and venues inside a query.
+
+    Built from a ScheduleStore's interned names. Phrases are keyed by
+    their first word, so only query words that start some name are looked
+    at further; the longest phrase found wins, so "football ground" is the
+    venue rather than the event.
+    """
+
+    def __init__(self, store):
+        catalog = store.catalog
+        phrases = {}  # normalized phrase -> (kind, ids, label)
+        for name_id in sorted(store.event_ids()):
+            for alias in aliases(catalog.names[name_id]):
+                self.__add(phrases, alias, "event", name_id)
+        for venue_id in sorted(store.venue_ids()):
+            self.__add(phrases, catalog.venues[venue_id], "venue", venue_id)
+        self.__phrases = phrases
+        self.__longest = max((len(phrase) for phrase in phrases), default=0)
+        self.__by_first_word = {}  # first word -> word counts of the phrases starting with it, longest first
+        for phrase in phrases:
+            words = phrase.split()
+            sizes = self.__by_first_word.setdefault(words[0], [])
+            if len(words) not in sizes:
+                sizes.append(len(words))
+                sizes.sort(reverse=True)
+
+    def __len__(self):
+        return len(self.__phrases)
+
+    def find(self, query):
+        """(kind, ids, label) for the longest event ("event") or venue ("venue") named in query, or None."""
+        words = normalize(query).split()
+        best = None
+        for start, word in enumerate(words):
+            for size in self.__by_first_word.get(word, ()):
+                found = self.__phrases.get(" " + " ".join(words[start:start + size]) + " ")
+                if found is not None:
+                    if best is None or len(found[2]) > len(best[2]):
+                        best = found
+                    break
+        return best
+
+    def exact(self, query):
+        """find() for a query that is nothing but an event or venue name (one dictionary lookup)."""
+        if len(query) > 2 * self.__longest:  # far too long to be just a name; skip normalizing
+            return None
+        return self.__phrases.get(normalize(query))
+
+    @staticmethod
+    def __add(phrases, text, kind, item_id):
+        phrase = normalize(text)
+        if len(phrase.strip()) < MIN_ALIAS_LENGTH:
+            return
+        found = phrases.get(phrase)
+        if found is None:
+            phrases[phrase] = (kind, (item_id,), text)
+        elif found[0] == kind and item_id not in found[1]:
+            phrases[phrase] = (kind, found[1] + (item_id,), found[2])
@@ -0,0 +1,146 @@
+import json
+import os
+import re
+import sys
+import threading
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "technovate.json")
+_CLOCK_RE = re.compile(r"(?:[01]?\d|2[0-3]):[0-5]\d")
+
+
+def _text(value, what):
+    if not isinstance(value, str):
+        raise ValueError(f"malformed festival data: {what} must be a string, not {value!r}")
+    return value
+
+
+def _clock(value, day):
+    if not isinstance(value, str) or not _CLOCK_RE.fullmatch(value):
+        raise ValueError(f"malformed festival data: slot time {value!r} on {day!r} is not HH:MM")
+    return value
+
+
+# ----------------- Parsed Festival Data -----------------
+class FestivalData:
+    """One parsed copy of the data file. Treated as read-only once built.
+
+    schedule: {"day N": {"HH:MM": "events"}}
+    faq:      [(intent, phrase, keywords, answer)] in matching priority order
+    answers:  {intent: answer} with "{theme}" already filled in
+    """
+
+    __slots__ = ("festival", "theme", "schedule", "faq", "answers")
+
+    def __init__(self, raw):
+        # Everything is checked here, so a bad edit is rejected as a whole
+        # instead of failing later halfway through applying it
+        try:
+            self.festival = _text(raw.get("festival", ""), "festival")
+            self.theme = _text(raw.get("theme", ""), "theme")
+            # Slot texts repeat across days (the nightly sports block...); keep one copy each
+            self.schedule = {str(day).lower(): {_clock(time, day): sys.intern(_text(event, f"event on {day} {time}"))
+                                                for time, event in slots.items()}
+                             for day, slots in raw["schedule"].items()}
+            self.faq = []
+            for entry in raw.get("faq", []):
+                intent = _text(entry["intent"], "intent")
+                keywords = entry["keywords"]
+                if not isinstance(keywords, (list, tuple)):
+                    raise ValueError(f"malformed festival data: keywords of {intent!r} must be a list")
+                self.faq.append((intent, _text(entry.get("phrase", intent), f"phrase of {intent!r}"),
+                                 tuple(_text(keyword, f"keyword of {intent!r}").lower() for keyword in keywords),
+                                 _text(entry["answer"], f"answer of {intent!r}")))
+            self.answers = {intent: answer.replace("{theme}", self.theme)
+                            for intent, _, _, answer in self.faq}
+        except (AttributeError, KeyError, TypeError) as error:
+            raise ValueError(f"malformed festival data: {error!r}") from None
+
+
+def _file_key(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load(path=DEFAULT_PATH):
+    """Parse and validate the JSON data file."""
+    with open(path, encoding="utf-8") as source:
+        return FestivalData(json.load(source))
+
+
+# ----------------- Hot-Reloading Source -----------------
+class DataSource:
+    """The current FestivalData, reloaded when the file changes on disk.
+
+    Reloads happen on a background polling thread (watch()) or on an explicit
+    check(). The new data is parsed completely before it replaces the old one
+    in a single assignment, so queries already running keep the copy they
+    started with and never wait on a reload. A file that fails to parse or
+    validate is reported in last_error and the previous data stays live; so
+    is a subscriber that raises, and the watcher keeps polling either way.
+    """
+
+    def __init__(self, path=DEFAULT_PATH, poll_interval=2.0):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.last_error = None
+        self.__key = _file_key(path)
+        self.__data = load(path)
+        self.__listeners = []
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread = None
+
+    @property
+    def data(self):
+        return self.__data
+
+    def subscribe(self, callback):
+        """callback(data) runs after every successful reload."""
+        self.__listeners.append(callback)
+
+    def check(self):
+        """Reload if the file changed since the last look; True if new data was swapped in."""
+        with self.__lock:
+            try:
+                key = _file_key(self.path)
+            except OSError as error:
+                self.last_error = error
+                return False
+            if key == self.__key:
+                return False
+            self.__key = key  # a broken file is not retried until it changes again
+            try:
+                data = load(self.path)
+            except (OSError, ValueError) as error:
+                self.last_error = error
+                return False
+            self.__data = data
+            self.last_error = None
+        for callback in self.__listeners:
+            try:
+                callback(data)
+            except Exception as error:  # one failing subscriber must not starve the others
+                self.last_error = error
+        return True
+
+    def watch(self):
+        """Start polling the file every poll_interval seconds on a daemon thread."""
+        with self.__lock:
+            if self.__thread is None:
+                self.__stop.clear()
+                self.__thread = threading.Thread(target=self.__poll, name="data-watcher", daemon=True)
+                self.__thread.start()
+
+    def close(self):
+        self.__stop.set()
+        with self.__lock:
+            thread, self.__thread = self.__thread, None
+        if thread is not None:
+            thread.join(timeout=self.poll_interval + 1)
+
+    def __poll(self):
+        while not self.__stop.wait(self.poll_interval):
+            try:
+                self.check()
+            except Exception as error:  # keep watching; the next edit may fix it
+                self.last_error = error
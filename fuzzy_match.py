@@ -0,0 +1,68 @@
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+
+
+# ----------------- Indexed Fuzzy Keyword Matcher -----------------
+class FuzzyMatcher:
+    """Picks the keyword with the best SequenceMatcher ratio against a query.
+
+    Each keyword's character histogram is precomputed and kept in an inverted
+    index (char -> keywords), so a query only touches keywords it shares
+    characters with.  Those are ranked by the quick_ratio upper bound and
+    scoring stops as soon as no remaining keyword can beat the current best.
+    Results are identical to scoring every (query, keyword) pair in order.
+    """
+
+    def __init__(self, entries, threshold=0.6):
+        self.__threshold = threshold
+        self.__keywords = []                  # order -> keyword
+        self.__intents = []                   # order -> intent
+        self.__char_index = defaultdict(list)  # char -> [(order, count)]
+        for keyword, intent in entries:
+            order = len(self.__keywords)
+            self.__keywords.append(keyword)
+            self.__intents.append(intent)
+            for char, count in Counter(keyword).items():
+                self.__char_index[char].append((order, count))
+
+    def best_match(self, query):
+        """Return the intent of the best keyword scoring above the threshold, or None."""
+        if not query:
+            return None
+
+        # Shortlist: multiset character overlap with every keyword that shares a char
+        overlap = defaultdict(int)
+        for char, q_count in Counter(query).items():
+            for order, k_count in self.__char_index.get(char, ()):
+                overlap[order] += q_count if q_count < k_count else k_count
+
+        q_len = len(query)
+        threshold = self.__threshold
+        shortlist = []
+        for order, shared in overlap.items():
+            total = q_len + len(self.__keywords[order])
+            bound = 2.0 * shared / total
+            shorter = min(q_len, total - q_len)
+            length_bound = 2.0 * shorter / total
+            if length_bound < bound:
+                bound = length_bound
+            if bound > threshold:
+                shortlist.append((-bound, order))
+        shortlist.sort()
+
+        matcher = SequenceMatcher(None, query)
+        best_score = 0
+        best_order = None
+        for neg_bound, order in shortlist:
+            bound = -neg_bound
+            if bound < best_score or (bound == best_score and order > best_order):
+                break
+            matcher.set_seq2(self.__keywords[order])
+            score = matcher.ratio()
+            if score > best_score or (score == best_score and best_order is not None and order < best_order):
+                best_score = score
+                best_order = order
+
+        if best_order is None or best_score <= threshold:
+            return None
+        return self.__intents[best_order]
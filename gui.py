@@ -1,192 +1,35 @@
 import tkinter as tk
-from tkinter import scrolledtext, Menu
-from abc import ABC, abstractmethod
-from datetime import datetime
-import pyttsx3
-import threading
-import time
+from tkinter import scrolledtext, Menu, filedialog
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from speech_worker import SpeechWorker
+from tts_engine import LazyEngine
+from audio_cache import AudioCache
+from transcript import Transcript
+from instrumentation import timed
+from bot_core import FestivalBot, TechnovateBot, spoken  # the shared engine; this module is the Tk + voice front-end
 
 # Setting up the voice engine
-engine = pyttsx3.init()
-engine.setProperty('rate', 160)
-engine.setProperty('voice', engine.getProperty('voices')[0].id)
-
-# ----------------- Abstract Base Class -----------------
-class FestivalBot(ABC):
-    @abstractmethod
-    def greet(self): pass
-
-    @abstractmethod
-    def handle_query(self, query): pass
-
-    @abstractmethod
-    def show_schedule(self, day): pass
-
-# ----------------- Derived Class: TechnovateBot -----------------
-class TechnovateBot(FestivalBot):
-    def __init__(self):
-        self.__schedule = {
-            "day 1": {
-                "10:30": "🎤 Opening Ceremony (Auditorium)",
-                "12:00": "🎤 Mic Mania (Auditorium)",
-                "15:00": "🎶 Singing (Auditorium)",
-                "16:00": "🎭 Nukkad Natak (Parking Area), 💻 Hackathon Begins",
-                "16:30": "🏏 Cricket (Ground near BALCO)",
-                "18:00": "🏸 Badminton (Sports Complex), 🏓 Table Tennis (Gym), 🏐 Volleyball (Court), 🏀 Basketball (Sports Complex), ⚽ Football (Football Ground)"
-            },
-            "day 2": {
-                "09:00": "💻 Hackathon Continues",
-                "11:00": "🧠 Quiz Runner (Room 121)",
-                "12:00": "💃 Groovify (Auditorium)",
-                "15:00": "💃 Group Dance (Auditorium), 🎭 ComicCon (Palm Park)",
-                "16:30": "🏏 Cricket (Ground near BALCO)",
-                "18:00": "🏸 Badminton (Sports Complex), 🏓 Table Tennis (Gym), 🏐 Volleyball (Court), 🏀 Basketball (Sports Complex), ⚽ Football (Football Ground)"
-            },
-            "day 3": {
-                "10:00": "🤝 Fiducia – Preliminary Round (Auditorium)",
-                "11:00": "👨‍💻 Coding Speedrun (Network Lab)",
-                "12:00": "🤝 Fiducia – Final Round (Auditorium)",
-                "16:30": "🏏 Cricket (Ground near BALCO)",
-                "18:00": "🏸 Badminton (Sports Complex), 🏓 Table Tennis (Gym), 🏐 Volleyball (Court), 🏀 Basketball (Sports Complex), ⚽ Football (Football Ground)",
-                "20:00": "🎤 Artist Night – Seedhe Maut Live Performance"
-            }
-        }
-
-        self.__theme_2025 = "🌟 Innovation and Collaboration Redefined 🌟"
-        self.__commands = {
-            "what is technovate": self.about_technovate,
-            "theme for 2025": self.theme,
-            "team required": self.team_requirement,
-            "technical events": self.tech_events,
-            "cultural events": self.cultural_events,
-            "talent show": self.open_stage,
-            "external participants": self.external_participation,
-            "how to register": self.registration_info,
-            "register for events": self.event_registration,
-            "accommodation": self.accommodation_info,
-            "food": self.food_info,
-            "contact": self.contact_info,
-            "last year theme": self.previous_theme,
-            "celebrity guests": self.celeb_guests,
-            "sponsors": self.past_sponsors,
-            "help": self.__help
-        }
-        self.response = ""
-
-    def speak(self, text):
-        threading.Thread(target=self.__speak_thread, args=(text,)).start()
-
-    def __speak_thread(self, text):
-        engine.say(text)
-        engine.runAndWait()
-
-    def greet(self):
-        self.response = "🎉 Welcome to Technovate 6.0 Bot! Type 'help' for suggestions or 'exit' to quit."
-        self.speak(self.response)
-        return self.response
-
-    def handle_query(self, query):
-        query = query.lower().strip()
-        for key in self.__commands:
-            if key in query:
-                self.__commands[key]()
-                return self.response
-
-        if "day" in query and any(char.isdigit() for char in query):
-            return self.__handle_day_time_query(query)
-        else:
-            self.response = "🤔 I didn't catch that. Try 'events on Day 2 at 3 PM' or type 'help'."
-            self.speak(self.response)
-            return self.response
-
-    def show_schedule(self, day):
-        schedule = self.__schedule.get(day, {})
-        if not schedule:
-            self.response = "😔 Sorry, no events listed for that day."
-            self.speak(self.response)
-            return self.response
-        output = []
-        for time, event in schedule.items():
-            output.append(f"🕒 {time} – {event}")
-        self.response = "\n".join(output)
-        self.speak(self.response)
-        return self.response
-
-    def __handle_day_time_query(self, query):
-        day = ""
-        for d in ["day 1", "day 2", "day 3"]:
-            if d in query:
-                day = d
-                break
-
-        time = self.__extract_time(query)
-
-        if not day:
-            self.response = "❗ Please mention a valid day (Day 1, Day 2, Day 3)."
-            self.speak(self.response)
-            return self.response
-
-        if not time:
-            self.response = f"📅 Here's everything on {day.title()}:\n" + self.show_schedule(day)
-            return self.response
-
-        event = self.__schedule.get(day, {}).get(time)
-        if event:
-            self.response = f"📍 At {time} on {day.title()}, you’ll find:\n👉 {event}"
-        else:
-            self.response = f"😅 No event exactly at {time} on {day.title()}. Here's the full day schedule:\n" + self.show_schedule(day)
-        self.speak(self.response)
-        return self.response
-
-    def __extract_time(self, text):
-        text = text.replace("pm", " PM").replace("am", " AM")
-        for word in text.split():
-            try:
-                return datetime.strptime(word, "%I%p").strftime("%H:00")
-            except:
-                pass
-            try:
-                return datetime.strptime(word, "%I:%M%p").strftime("%H:%M")
-            except:
-                pass
-        return None
-
-    def __help(self):
-        self.response = (
-            "💬 You can ask me things like:\n"
-            "- 'What's happening on Day 2?'\n"
-            "- 'Events at 4:30 PM on Day 3?'\n"
-            "- 'Theme for 2025?'\n"
-            "- 'Technical events?'\n"
-            "- 'How to register?'"
-        )
-        self.speak(self.response)
-
-    # FAQ functions
-    def about_technovate(self): self.__set_response("🎉 Technovate is the annual tech-cultural fest of our college!")
-    def theme(self): self.__set_response(f"🎨 This year’s theme is \"{self.__theme_2025}\".")
-    def team_requirement(self): self.__set_response("👥 Some events are solo, others are team events (2–4 members).")
-    def tech_events(self): self.__set_response("🛠️ Hackathons, coding contests, robotics, quizzes await you!")
-    def cultural_events(self): self.__set_response("🎭 Dance battles, music shows, drama, fashion shows!")
-    def open_stage(self): self.__set_response("🎤 Yes, open mic for singers, poets, performers is available!")
-    def external_participation(self): self.__set_response("🌐 External participants are allowed in several events.")
-    def registration_info(self): self.__set_response("📝 Register via our official Technovate website!")
-    def event_registration(self): self.__set_response("📝 Each event has its own registration link.")
-    def accommodation_info(self): self.__set_response("🏠 Hostels available for outstation participants.")
-    def food_info(self): self.__set_response("🍕 Food stalls, canteens, and a food court available!")
-    def contact_info(self): self.__set_response("📞 Visit 'Contact Us' page for coordinator contacts.")
-    def previous_theme(self): self.__set_response("🛤️ 2024’s theme was ‘Beyond Boundaries’.")
-    def celeb_guests(self): self.__set_response("🌟 Past guests: Samay Raina, Seedhe Maut!")
-    def past_sponsors(self): self.__set_response("🏆 Jungle Safari was a proud sponsor!")
-
-    def __set_response(self, text):
-        self.response = text
-        self.speak(text)
+engine = LazyEngine(rate=160, voice_index=0)
+speech = SpeechWorker(engine.get, audio_cache=AudioCache(), stream=True)
 
 # ----------------- GUI Application -----------------
 class ChatGUI:
-    def __init__(self, root):
+    def __init__(self, root, typing_delay_ms=400, poll_interval_ms=30, max_lines=2000, voice=True):
+        # Replies are computed on worker threads; only the Tk thread touches widgets
+        self.typing_delay_ms = typing_delay_ms  # show "Typing..." only if an answer takes longer
+        self.poll_interval_ms = poll_interval_ms
+        self.__workers = ThreadPoolExecutor(max_workers=4, thread_name_prefix="bot-reply")
+        self.__pending = deque()  # futures in the order the messages were sent
+        self.__poll_job = None
+        self.__typing_job = None
+
+        self.voice = voice
+        if voice:
+            speech.start()
         self.bot = TechnovateBot()
+        if voice:
+            speech.prewarm(self.bot.known_speech())
         self.root = root
         self.root.title("Technovate 6.0 Chatbot")
         self.root.geometry("600x700")
@@ -194,6 +37,11 @@ class ChatGUI:
         # 🛠️ Create widgets first
         self.chat_area = scrolledtext.ScrolledText(root, wrap=tk.WORD, state='disabled', font=("Arial", 12))
         self.chat_area.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
+        # Bounded transcript: old lines are trimmed in chunks and spooled to disk
+        self.transcript = Transcript(self.chat_area, {
+            "left": {"justify": 'left', "foreground": "blue"},
+            "right": {"justify": 'right', "foreground": "green"},
+        }, max_lines=max_lines)
 
         self.entry = tk.Entry(root, font=("Arial", 14))
         self.entry.pack(padx=10, pady=10, fill=tk.X)
@@ -206,11 +54,16 @@ class ChatGUI:
         menu.add_cascade(label="View", menu=view_menu)
         view_menu.add_command(label="Light Mode", command=self.light_mode)
         view_menu.add_command(label="Dark Mode", command=self.dark_mode)
+        file_menu = Menu(menu, tearoff=0)
+        menu.add_cascade(label="File", menu=file_menu)
+        file_menu.add_command(label="Save Transcript...", command=self.save_transcript)
 
         # 🎨 Set theme now
         self.light_mode()
 
-        self.display_message("Technovate Bot", self.bot.greet())
+        greeting = self.bot.greet().strip()
+        self.display_message("Technovate Bot", greeting)
+        self.speak(spoken(greeting))
 
     def light_mode(self):
         self.root.configure(bg="#f1f1f1")
@@ -222,16 +75,22 @@ class ChatGUI:
         self.chat_area.configure(bg="#23272a", fg="white")
         self.entry.configure(bg="#2c2f33", fg="white")
 
+    @timed("display_message")
     def display_message(self, sender, message, side="left"):
-        self.chat_area.config(state='normal')
         if side == "left":
-            self.chat_area.insert(tk.END, f"\n{sender}: {message}\n", "left")
+            self.transcript.append(f"\n{sender}: {message}\n", "left")
         else:
-            self.chat_area.insert(tk.END, f"\nYou: {message}\n", "right")
-        self.chat_area.tag_configure("left", justify='left', foreground="blue")
-        self.chat_area.tag_configure("right", justify='right', foreground="green")
-        self.chat_area.config(state='disabled')
-        self.chat_area.yview(tk.END)
+            self.transcript.append(f"\nYou: {message}\n", "right")
+
+    @timed("speak")
+    def speak(self, text):
+        if self.voice:
+            speech.say(text)
+
+    def save_transcript(self):
+        path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text", "*.txt")])
+        if path:
+            self.transcript.save(path)
 
     def send_message(self, event=None):
         user_msg = self.entry.get()
@@ -241,22 +100,66 @@ class ChatGUI:
         self.entry.delete(0, tk.END)
 
         if user_msg.lower() in ["exit", "quit", "bye"]:
-            self.display_message("Technovate Bot", "👋 Goodbye! Enjoy Technovate 6.0!", side="left")
-            self.root.after(2000, self.root.destroy)
+            farewell = self.bot.farewell()
+            self.display_message("Technovate Bot", farewell.removeprefix("Bot: "), side="left")
+            self.speak(spoken(farewell))
+            self.root.after(2000, self.close)
             return
 
-        threading.Thread(target=self.bot_reply, args=(user_msg,)).start()
+        self.__pending.append(self.__workers.submit(self.bot_reply, user_msg))
+        if self.__typing_job is None:
+            self.__typing_job = self.root.after(self.typing_delay_ms, self.__show_typing)
+        if self.__poll_job is None:
+            self.__poll_job = self.root.after(self.poll_interval_ms, self.__poll_replies)
 
     def bot_reply(self, user_msg):
-        time.sleep(0.5)
-        self.display_message("Technovate Bot", "💬 Typing...", side="left")
-        time.sleep(1)
+        # Runs on a worker thread: compute only, never touch Tk from here
+        return self.bot.answer(user_msg)
+
+    def __poll_replies(self):
+        self.__poll_job = None
+        while self.__pending and self.__pending[0].done():
+            future = self.__pending.popleft()
+            try:
+                reply = future.result()
+                # The sender is already shown, so drop the reply's own "Bot:" label
+                bot_response, bot_speech = reply.text.strip().removeprefix("Bot: "), reply.speech
+            except Exception as error:
+                bot_response = f"⚠️ Sorry, something went wrong: {error}"
+                bot_speech = "Sorry, something went wrong."
+            self.__hide_typing()
+            self.display_message("Technovate Bot", bot_response, side="left")
+            self.speak(bot_speech)
+        if self.__pending:
+            if self.__typing_job is None and not self.chat_area.tag_ranges("typing"):
+                self.__typing_job = self.root.after(self.typing_delay_ms, self.__show_typing)
+            self.__poll_job = self.root.after(self.poll_interval_ms, self.__poll_replies)
+
+    def __show_typing(self):
+        # Purely cosmetic, and only reached when the real answer is slow
+        self.__typing_job = None
+        if not self.__pending or self.chat_area.tag_ranges("typing"):
+            return
         self.chat_area.config(state='normal')
-        self.chat_area.delete("end-2l", "end-1l")
+        self.chat_area.insert(tk.END, "\nTechnovate Bot: 💬 Typing...\n", ("left", "typing"))
         self.chat_area.config(state='disabled')
+        self.chat_area.yview(tk.END)
 
-        bot_response = self.bot.handle_query(user_msg)
-        self.display_message("Technovate Bot", bot_response, side="left")
+    def __hide_typing(self):
+        if self.__typing_job is not None:
+            self.root.after_cancel(self.__typing_job)
+            self.__typing_job = None
+        ranges = self.chat_area.tag_ranges("typing")
+        if ranges:
+            self.chat_area.config(state='normal')
+            self.chat_area.delete(ranges[0], ranges[-1])
+            self.chat_area.config(state='disabled')
+
+    def close(self):
+        self.__workers.shutdown(wait=False, cancel_futures=True)
+        self.bot.close()
+        self.transcript.close()
+        self.root.destroy()
 
 # ----------------- Run the Application -----------------
 if __name__ == "__main__":
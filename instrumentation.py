@@ -0,0 +1,191 @@
+"""Optional per-stage timing for the bot's hot paths.
+
+    TECHNOVATE_INSTRUMENT=1 python gui.py          # record
+    TECHNOVATE_STATS_INTERVAL=30 ...               # and dump stats every 30 s to stderr
+
+or from code: instrumentation.enable(); ...; instrumentation.stats()
+
+Stages are marked with @timed("stage"). While disabled (the default) the
+plain functions are in place, so instrumentation costs nothing per call.
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+
+_BUCKETS = 26  # bucket i holds durations below 2**i microseconds; the last one is open-ended
+
+
+# ----------------- Latency Histogram -----------------
+class Histogram:
+    """Log2-bucketed latency histogram: fixed memory whatever the call volume."""
+
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self):
+        self.counts = [0] * _BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = 0.0
+
+    def add(self, seconds):
+        micros = int(seconds * 1e6)
+        self.counts[min(micros.bit_length(), _BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if self.minimum is None or seconds < self.minimum:
+            self.minimum = seconds
+        if seconds > self.maximum:
+            self.maximum = seconds
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding that fraction of calls, in seconds."""
+        if not self.count:
+            return 0.0
+        wanted = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= wanted and bucket:
+                return min((1 << index) / 1e6, self.maximum)
+        return self.maximum
+
+    def summary(self):
+        if not self.count:
+            return {"count": 0}
+        buckets = {f"<{1 << index}": bucket for index, bucket in enumerate(self.counts[:-1]) if bucket}
+        if self.counts[-1]:
+            buckets[f">={1 << (_BUCKETS - 2)}"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count * 1000, 4),
+            "min_ms": round(self.minimum * 1000, 4),
+            "p50_ms": round(self.percentile(0.50) * 1000, 4),
+            "p90_ms": round(self.percentile(0.90) * 1000, 4),
+            "p99_ms": round(self.percentile(0.99) * 1000, 4),
+            "max_ms": round(self.maximum * 1000, 4),
+            "buckets_us": buckets,
+        }
+
+
+# ----------------- Stage Recorder -----------------
+class Instrumentation:
+    def __init__(self):
+        self.enabled = False
+        self.__sites = []  # (class or module, attribute, plain function, timing wrapper)
+        self.__histograms = {}
+        self.__lock = threading.Lock()
+        self.__dumper = None
+        self.__stop = threading.Event()
+
+    def record(self, stage, seconds):
+        with self.__lock:
+            histogram = self.__histograms.get(stage)
+            if histogram is None:
+                histogram = self.__histograms[stage] = Histogram()
+            histogram.add(seconds)
+
+    def timed(self, stage):
+        """Decorator for functions and methods: record each call's wall time under stage.
+
+        The undecorated function stays in place while disabled; enable() swaps
+        the timing wrapper in on the class or module and disable() swaps it out.
+        """
+        def decorate(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:  # a bound method grabbed while enabled
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(stage, time.perf_counter() - start)
+
+            if "." in func.__qualname__:
+                return _TimedMethod(self, func, wrapper)  # owner class is known only in __set_name__
+            self.__sites.append((sys.modules[func.__module__], func.__name__, func, wrapper))
+            return wrapper if self.enabled else func
+        return decorate
+
+    def _add_site(self, owner, name, func, wrapper):
+        self.__sites.append((owner, name, func, wrapper))
+        setattr(owner, name, wrapper if self.enabled else func)
+
+    def enable(self):
+        self.enabled = True
+        for owner, name, _, wrapper in self.__sites:
+            setattr(owner, name, wrapper)
+
+    def disable(self):
+        self.enabled = False
+        for owner, name, func, _ in self.__sites:
+            setattr(owner, name, func)
+
+    def stats(self):
+        """{stage: {count, mean_ms, p50_ms, p90_ms, p99_ms, max_ms, buckets_us}}"""
+        with self.__lock:
+            return {stage: histogram.summary() for stage, histogram in sorted(self.__histograms.items())}
+
+    def reset(self):
+        with self.__lock:
+            self.__histograms.clear()
+
+    def start_dump(self, interval=60.0, stream=None):
+        """Write stats() as one JSON line to stream (default stderr) every interval seconds."""
+        with self.__lock:
+            if self.__dumper is not None:
+                return
+            self.__stop.clear()
+            self.__dumper = threading.Thread(target=self.__dump_loop, args=(interval, stream),
+                                             name="stats-dump", daemon=True)
+            self.__dumper.start()
+
+    def stop_dump(self):
+        self.__stop.set()
+        with self.__lock:
+            dumper, self.__dumper = self.__dumper, None
+        if dumper is not None:
+            dumper.join(timeout=1)
+
+    def __dump_loop(self, interval, stream):
+        while not self.__stop.wait(interval):
+            line = json.dumps({"time": round(time.time(), 3), "stages": self.stats()})
+            print(line, file=stream or sys.stderr, flush=True)
+
+
+class _TimedMethod:
+    """Stands in for a @timed method until its class exists, then installs the real function."""
+
+    def __init__(self, instruments, func, wrapper):
+        self.instruments = instruments
+        self.func = func
+        self.wrapper = wrapper
+
+    def __set_name__(self, owner, name):
+        self.instruments._add_site(owner, name, self.func, self.wrapper)
+
+
+# One process-wide recorder; the module functions below act on it
+instruments = Instrumentation()
+timed = instruments.timed
+record = instruments.record
+stats = instruments.stats
+reset = instruments.reset
+start_dump = instruments.start_dump
+stop_dump = instruments.stop_dump
+enable = instruments.enable
+disable = instruments.disable
+
+
+def is_enabled():
+    return instruments.enabled
+
+
+if os.environ.get("TECHNOVATE_INSTRUMENT", "") not in ("", "0"):
+    enable()
+    if os.environ.get("TECHNOVATE_STATS_INTERVAL"):
+        start_dump(float(os.environ["TECHNOVATE_STATS_INTERVAL"]))
@@ -0,0 +1,74 @@
+from collections import deque
+
+
+# ----------------- Aho–Corasick Intent Index -----------------
+class IntentIndex:
+    """Finds every registered phrase inside a query in a single pass.
+
+    Phrases are given in priority order; when several phrases occur in the
+    same query the intent of the earliest registered one wins, exactly like
+    the old "first key in the dict that is a substring" loop.
+    """
+
+    def __init__(self, phrases):
+        self.__goto = [{}]        # node -> {char: next node}
+        self.__fail = [0]         # node -> fallback node
+        self.__best = [None]      # node -> lowest priority ending here (incl. suffixes)
+        self.__intents = []       # priority -> intent
+
+        seen = set()
+        for phrase, intent in phrases:
+            if not phrase or phrase in seen:
+                continue
+            seen.add(phrase)
+            self.__add(phrase, len(self.__intents))
+            self.__intents.append(intent)
+        self.__build_links()
+
+    def __len__(self):
+        return len(self.__intents)
+
+    def __add(self, phrase, priority):
+        node = 0
+        for char in phrase:
+            nxt = self.__goto[node].get(char)
+            if nxt is None:
+                nxt = len(self.__goto)
+                self.__goto[node][char] = nxt
+                self.__goto.append({})
+                self.__fail.append(0)
+                self.__best.append(None)
+            node = nxt
+        self.__best[node] = priority
+
+    def __build_links(self):
+        goto, fail, best = self.__goto, self.__fail, self.__best
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                queue.append(child)
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+                fallback = goto[state].get(char, 0)
+                fail[child] = fallback if fallback != child else 0
+                inherited = best[fail[child]]
+                if inherited is not None and (best[child] is None or inherited < best[child]):
+                    best[child] = inherited
+
+    def first_match(self, text):
+        """Return the highest-priority intent whose phrase occurs in text, or None."""
+        goto, fail, best = self.__goto, self.__fail, self.__best
+        node = 0
+        winner = None
+        for char in text:
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            found = best[node]
+            if found is not None and (winner is None or found < winner):
+                winner = found
+                if winner == 0:
+                    break
+        return None if winner is None else self.__intents[winner]
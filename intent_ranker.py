@@ -0,0 +1,186 @@
+import heapq
+import math
+import re
+from array import array
+from collections import Counter
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Glue and question words carry no intent on their own ("what" alone must not
+# pick "what is technovate"); inside a multi-word keyword they still count,
+# because the whole keyword is also indexed as one phrase term.
+STOPWORDS = frozenset(
+    "a an the is are was were be been am do does did i me my we our you your it its this that "
+    "there here of on in at to for from by with and or as any some can could would will shall "
+    "what how who where when which why please tell hi hello hey ok okay thanks thank".split())
+MAX_PHRASE_WORDS = 4
+
+
+def _stem(token):
+    if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Lower-case word tokens without stopwords; a trailing plural 's' is dropped."""
+    return [_stem(token) for token in _TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def phrase_term(text):
+    """"What can you do" -> "what_can_you_do" (None for single words)."""
+    words = [_stem(word) for word in _TOKEN_RE.findall(text.lower())]
+    return "_".join(words) if 1 < len(words) <= MAX_PHRASE_WORDS else None
+
+
+def query_terms(text, phrase_starts=None):
+    """tokenize(text) plus the 2..MAX_PHRASE_WORDS-word runs that could be multi-word keywords.
+
+    phrase_starts, if given, limits the runs to those starting with one of its words.
+    """
+    raw = _TOKEN_RE.findall(text.lower())
+    terms = [_stem(word) for word in raw if word not in STOPWORDS]  # as tokenize(): "does" is not "doe"
+    words = [_stem(word) for word in raw]
+    for start, word in enumerate(words):
+        if phrase_starts is not None and word not in phrase_starts:
+            continue
+        for end in range(start + 2, min(start + MAX_PHRASE_WORDS, len(words)) + 1):
+            terms.append("_".join(words[start:end]))
+    return terms
+
+
+# ----------------- BM25 Intent Ranker -----------------
+class IntentRanker:
+    """Ranks intents for a query with BM25 over their keywords, phrase and answer text.
+
+    The term x intent weight matrix is built once and stored sparse,
+    column-per-term (CSC: indptr / indices / data arrays), so scoring a query
+    is one sparse matrix-vector product that only touches the postings of
+    the query's own terms.  A keyword occurrence counts keyword_weight, a
+    word of the command phrase phrase_weight and a word of the answer text
+    answer_weight (answers are long and wordy, so they only break ties).
+    A multi-word command phrase is also one term of command_weight, so
+    typing the phrase itself ("how to register") picks its intent even
+    when its single words are stopwords or shared with other intents.
+
+    Only intents the query hits through a keyword or their phrase are
+    ranked at all: answer text alone ("is there parking", where only some
+    answer mentions parking) never makes an intent an answer, nor does one
+    word of a multi-word keyword ("open" of "open mic").  Confidence is
+    the share of the query's IDF mass those hits explain (unknown and
+    answer-only words lower it) times the top intent's share of the total
+    score, so a query split between several intents scores low.
+    """
+
+    def __init__(self, entries, k1=1.2, b=0.75, keyword_weight=3, phrase_weight=2, answer_weight=0.5,
+                 command_weight=8):
+        # entries: iterable of (intent, phrase, keywords, answer)
+        self.intents = []
+        documents = []
+        anchors = []  # per intent: its single-word keywords, whole multi-word keywords and phrase terms
+        self.__phrase_starts = set()
+        for intent, phrase, keywords, answer in entries:
+            terms = Counter()
+            anchored = set()
+            for keyword in keywords:
+                for token in tokenize(keyword):
+                    terms[token] += keyword_weight
+                joined = phrase_term(keyword)
+                if joined:
+                    terms[joined] += keyword_weight
+                    anchored.add(joined)
+                    self.__phrase_starts.add(joined.split("_", 1)[0])
+                else:
+                    anchored.update(tokenize(keyword))
+            for token in tokenize(phrase):
+                terms[token] += phrase_weight
+                anchored.add(token)
+            joined = phrase_term(phrase)
+            if joined:
+                terms[joined] += command_weight
+                anchored.add(joined)
+                self.__phrase_starts.add(joined.split("_", 1)[0])
+            anchors.append(anchored)
+            for token in tokenize(answer):
+                terms[token] += answer_weight
+            self.intents.append(intent)
+            documents.append(terms)
+        self.__priority = {}  # intent -> position of its first entry
+        for position, intent in enumerate(self.intents):
+            self.__priority.setdefault(intent, position)
+
+        count = len(documents)
+        lengths = [sum(terms.values()) for terms in documents]
+        average = sum(lengths) / count if count else 1.0
+        postings = {}
+        for doc, terms in enumerate(documents):
+            norm = k1 * (1 - b + b * lengths[doc] / average)
+            for term, frequency in terms.items():
+                postings.setdefault(term, []).append((doc, frequency * (k1 + 1) / (frequency + norm),
+                                                      term in anchors[doc]))
+
+        self.__vocabulary = {}           # term -> column
+        self.__idf = array("d")          # column -> idf
+        self.__indptr = array("l", [0])  # column -> start of its postings
+        self.__indices = array("l")      # posting -> intent row
+        self.__data = array("d")         # posting -> idf * saturated tf
+        self.__anchored = array("b")     # posting -> 1 if the term is a keyword / phrase term of that intent
+        for term, column_postings in sorted(postings.items()):
+            idf = math.log(1 + (count - len(column_postings) + 0.5) / (len(column_postings) + 0.5))
+            self.__vocabulary[term] = len(self.__idf)
+            self.__idf.append(idf)
+            for doc, weight, anchored in column_postings:
+                self.__indices.append(doc)
+                self.__data.append(idf * weight)
+                self.__anchored.append(anchored)
+            self.__indptr.append(len(self.__indices))
+        # A word the data never uses counts like the rarest word it does use
+        self.__unknown_idf = max(self.__idf, default=1.0)
+
+    def rank(self, query, limit=3):
+        """[(intent, confidence)] best first, at most limit entries (empty if nothing matched)."""
+        return self.__rank_terms(query_terms(query, self.__phrase_starts), limit)
+
+    def best(self, ranked, min_confidence=0.0, min_margin=0.0):
+        """The top intent of a rank() result if its confidence reaches min_confidence, else None.
+
+        Intents scoring within min_margin of the top one count as a tie,
+        which goes to the one listed first (the same priority the keyword
+        matchers use), not to whichever the answer texts happen to favour.
+        """
+        if not ranked or ranked[0][1] < min_confidence:
+            return None
+        tied = [intent for intent, confidence in ranked if ranked[0][1] - confidence < min_margin]
+        return min(tied, key=self.__priority.__getitem__) if len(tied) > 1 else ranked[0][0]
+
+    def __rank_terms(self, terms, limit):
+        if not terms:
+            return []
+        scores = {}  # only the rows the query's columns touch
+        hit = set()  # rows hit through a keyword / phrase term
+        vocabulary, idf, indptr, indices, data, anchored = (self.__vocabulary, self.__idf, self.__indptr,
+                                                            self.__indices, self.__data, self.__anchored)
+        query_mass = matched_mass = 0.0
+        for term in set(terms):
+            column = vocabulary.get(term)
+            if column is None:
+                # unmatched word runs and numbers (years, typos of them) are expected; unknown words are not
+                if "_" not in term and not term.isdigit():
+                    query_mass += self.__unknown_idf
+                continue
+            query_mass += idf[column]
+            keyword_hit = False
+            for position in range(indptr[column], indptr[column + 1]):
+                row = indices[position]
+                scores[row] = scores.get(row, 0.0) + data[position]
+                if anchored[position]:
+                    hit.add(row)
+                    keyword_hit = True
+            if keyword_hit:
+                matched_mass += idf[column]
+
+        if not hit:
+            return []
+        scale = matched_mass / query_mass / sum(scores.values())  # coverage x share of the total
+        ranked = heapq.nsmallest(limit, ((row, scores[row]) for row in hit), key=lambda item: (-item[1], item[0]))
+        return [(self.intents[row], round(score * scale, 4)) for row, score in ranked]
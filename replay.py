@@ -0,0 +1,201 @@
+"""Replay recorded kiosk conversations against the current bot.
+
+    python replay.py kiosk.log [--workers 8] [--format auto|text|transcript|jsonl]
+
+Log formats:
+    text        one query per line
+    transcript  a saved chat transcript; only the "You: ..." lines are replayed
+    jsonl       one JSON object per line with a "query" field and, optionally,
+                the expected "intent" (then accuracy is reported too)
+
+The log is streamed through a generator pipeline (lines -> queries ->
+batches) and batches are answered by a ProcessPoolExecutor whose workers
+each build one TechnovateBot. At most a few batches are in flight at once,
+so memory stays flat however large the log is. The report is JSON: intent
+distribution, unmatched rate, accuracy (when labelled) and throughput.
+"""
+import argparse
+import gzip
+import itertools
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from festival_data import DEFAULT_PATH
+
+UNMATCHED = ("unknown", "no_day")
+TRANSCRIPT_SPEAKERS = ("You:", "Bot:", "Technovate Bot:")
+
+
+# ----------------- Streaming Pipeline -----------------
+def read_lines(path):
+    """Lines of a (possibly gzipped) log, or of stdin for "-", one at a time."""
+    if path == "-":
+        yield from sys.stdin
+        return
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8", errors="replace") as log:
+        yield from log
+
+
+def detect_format(path):
+    for line in read_lines(path):
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            return "jsonl"
+        if line.startswith(TRANSCRIPT_SPEAKERS):
+            return "transcript"
+        return "text"
+    return "text"
+
+
+def queries(lines, log_format):
+    """(query, expected_intent or None) for every replayable line."""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if log_format == "jsonl":
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and isinstance(record.get("query"), str):
+                yield record["query"], record.get("intent")
+        elif log_format == "transcript":
+            if line.startswith("You:"):
+                yield line[4:].strip(), None
+        else:
+            yield line, None
+
+
+def batches(items, size):
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+# ----------------- Worker Process -----------------
+_bot = None
+
+
+def _init_worker(data_path):
+    global _bot
+    from bot_core import TechnovateBot
+    _bot = TechnovateBot(data_path)
+
+
+def _answer_batch(batch):
+    """Intents for one batch, aggregated in the worker so only small counters travel back."""
+    replies = _bot.answer_many([query for query, _ in batch])
+    intents = Counter()
+    labelled = correct = 0
+    for (_, expected), reply in zip(batch, replies):
+        intents[reply.intent] += 1
+        if expected is not None:
+            labelled += 1
+            correct += reply.intent == expected
+    return intents, labelled, correct
+
+
+# ----------------- Replay -----------------
+class ReplayStats:
+    def __init__(self):
+        self.intents = Counter()
+        self.queries = 0
+        self.labelled = 0
+        self.correct = 0
+        self.started = time.perf_counter()
+
+    def add(self, result):
+        intents, labelled, correct = result
+        self.intents.update(intents)
+        self.queries += sum(intents.values())
+        self.labelled += labelled
+        self.correct += correct
+
+    def report(self):
+        elapsed = time.perf_counter() - self.started
+        unmatched = sum(self.intents[intent] for intent in UNMATCHED)
+        report = {
+            "queries": self.queries,
+            "seconds": round(elapsed, 3),
+            "queries_per_second": round(self.queries / elapsed, 1) if elapsed else None,
+            "unmatched": unmatched,
+            "unmatched_rate": round(unmatched / self.queries, 4) if self.queries else 0.0,
+            "intents": dict(self.intents.most_common()),
+        }
+        if self.labelled:
+            report["labelled"] = self.labelled
+            report["accuracy"] = round(self.correct / self.labelled, 4)
+        return report
+
+
+def replay(path, workers=None, batch_size=1000, log_format="auto", data_path=DEFAULT_PATH, progress=None):
+    """Replay the log at path and return the report dict.
+
+    workers=0 answers in this process (handy for small logs and debugging).
+    """
+    if log_format == "auto":
+        log_format = "text" if path == "-" else detect_format(path)
+    stream = batches(queries(read_lines(path), log_format), batch_size)
+    stats = ReplayStats()
+
+    if workers == 0:
+        _init_worker(data_path)
+        for batch in stream:
+            stats.add(_answer_batch(batch))
+            if progress:
+                progress(stats)
+        return stats.report()
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = workers * 2  # bounded: the log is never read far ahead of the workers
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(data_path,)) as pool:
+        in_flight = deque()
+        for batch in stream:
+            in_flight.append(pool.submit(_answer_batch, batch))
+            if len(in_flight) >= max_in_flight:
+                stats.add(in_flight.popleft().result())
+                if progress:
+                    progress(stats)
+        while in_flight:
+            stats.add(in_flight.popleft().result())
+    return stats.report()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log", help="log file (.gz is fine), or - for stdin")
+    parser.add_argument("--format", default="auto", choices=["auto", "text", "transcript", "jsonl"])
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: CPU count; 0 = in-process)")
+    parser.add_argument("--batch", type=int, default=1000, help="queries per task")
+    parser.add_argument("--data", default=DEFAULT_PATH, help="festival data file to answer from")
+    parser.add_argument("--quiet", action="store_true", help="no progress on stderr")
+    args = parser.parse_args()
+
+    last = [0.0]
+
+    def progress(stats):
+        now = time.perf_counter()
+        if now - last[0] >= 1.0:
+            last[0] = now
+            print(f"\r{stats.queries} queries", end="", file=sys.stderr, flush=True)
+
+    report = replay(args.log, args.workers, args.batch, args.format, args.data,
+                    progress=None if args.quiet else progress)
+    if not args.quiet:
+        print(file=sys.stderr)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
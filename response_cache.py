@@ -0,0 +1,64 @@
+import threading
+from collections import OrderedDict
+
+
+# ----------------- LRU Response Cache -----------------
+class ResponseCache:
+    """Size-bounded LRU cache of query -> response.
+
+    Queries are normalised (lower-case, whitespace collapsed) so trivially
+    different spellings of the same question share an entry. Every lookup
+    passes the bot's current data version; when it differs from the version
+    the cache was filled under, the cache empties itself, so edits to the
+    schedule or FAQ answers can never serve a stale reply.
+    """
+
+    def __init__(self, max_size=256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.__entries = OrderedDict()
+        self.__version = None
+        self.__lock = threading.Lock()
+
+    @staticmethod
+    def normalize(query):
+        return " ".join(query.lower().split())
+
+    def get_or_compute(self, query, compute, version=None):
+        """Cached response for query; on a miss compute(normalized_query) fills the entry."""
+        key = self.normalize(query)
+        with self.__lock:
+            if version != self.__version:
+                self.__entries.clear()
+                self.__version = version
+            if key in self.__entries:
+                self.__entries.move_to_end(key)
+                self.hits += 1
+                return self.__entries[key]
+            self.misses += 1
+
+        response = compute(key)
+
+        with self.__lock:
+            if version == self.__version:
+                self.__entries[key] = response
+                self.__entries.move_to_end(key)
+                while len(self.__entries) > self.max_size:
+                    self.__entries.popitem(last=False)
+        return response
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+
+    def stats(self):
+        with self.__lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.__entries),
+                "max_size": self.max_size,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
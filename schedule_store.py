@@ -0,0 +1,480 @@
+import re
+import sys
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from time_parser import format_time
+
+_VENUE_RE = re.compile(r"(.*\S) \(([^()]+)\)", re.S)
+NO_VENUE = -1
+
+
+def to_minutes(hhmm):
+    """'16:30' -> 990"""
+    hours, minutes = hhmm.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+def spoken_minutes(minutes):
+    """990 -> '4:30 PM', 960 -> '4 PM' (how a TTS engine should read it)"""
+    hour, minute = divmod(minutes, 60)
+    suffix = "AM" if hour < 12 else "PM"
+    hour = hour % 12 or 12
+    return f"{hour}:{minute:02d} {suffix}" if minute else f"{hour} {suffix}"
+
+
+def speakable(text):
+    """Drop emoji and other pictographs, and read dashes as pauses."""
+    kept = []
+    for char in text:
+        if char in "–—":
+            kept.append(",")
+        elif unicodedata.category(char) not in ("So", "Cs", "Cf") and char != "\ufe0f":
+            kept.append(char)
+    return " ".join("".join(kept).split()).replace(" ,", ",")
+
+
+def split_events(text):
+    """'A (X), B, C (Y, Z)' -> ['A (X)', 'B', 'C (Y, Z)']: splits on ", " outside parentheses."""
+    parts, depth, begin = [], 0, 0
+    for index, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(depth - 1, 0)
+        elif char == "," and not depth and text.startswith(", ", index):
+            parts.append(text[begin:index])
+            begin = index + 2
+    parts.append(text[begin:])
+    return parts
+
+
+# ----------------- Interned Names and Venues -----------------
+class EventCatalog:
+    """Interns event names and venues, so each distinct string is held once and slots store small ints.
+
+    lookups by name_id() / venue_id() ignore case.
+    """
+
+    def __init__(self):
+        self.names = []
+        self.venues = []
+        self.__name_ids = {}
+        self.__venue_ids = {}
+        self.__name_lookup = {}   # lower-cased -> id
+        self.__venue_lookup = {}
+
+    def parse(self, text):
+        """[(name_id, venue_id)] for a slot's text; render() of them gives the text back exactly."""
+        events = []
+        for part in split_events(text):
+            match = _VENUE_RE.fullmatch(part)
+            if match:
+                events.append((self.__intern(match.group(1), self.names, self.__name_ids, self.__name_lookup),
+                               self.__intern(match.group(2), self.venues, self.__venue_ids, self.__venue_lookup)))
+            else:
+                events.append((self.__intern(part, self.names, self.__name_ids, self.__name_lookup), NO_VENUE))
+        return events
+
+    def render(self, name_id, venue_id):
+        if venue_id == NO_VENUE:
+            return self.names[name_id]
+        return f"{self.names[name_id]} ({self.venues[venue_id]})"
+
+    def name_id(self, name):
+        return self.__name_lookup.get(name.lower())
+
+    def venue_id(self, venue):
+        return self.__venue_lookup.get(venue.lower())
+
+    @staticmethod
+    def __intern(text, strings, ids, lookup):
+        found = ids.get(text)
+        if found is None:
+            found = ids[text] = len(strings)
+            strings.append(sys.intern(text))
+            lookup.setdefault(text.lower(), found)
+        return found
+
+
+# ----------------- Schedule Entry -----------------
+class ScheduleEntry:
+    """One slot of a day: a view onto its DaySchedule's columns."""
+
+    __slots__ = ("schedule", "index")
+
+    def __init__(self, schedule, index):
+        self.schedule = schedule
+        self.index = index
+
+    @property
+    def start(self):
+        """Minutes from midnight, inclusive."""
+        return self.schedule.starts[self.index]
+
+    @property
+    def end(self):
+        """Minutes from midnight, exclusive."""
+        return self.schedule.ends[self.index]
+
+    @property
+    def time(self):
+        return format_time(self.start)
+
+    @property
+    def events(self):
+        """[(name, venue or None)] of everything in this slot."""
+        catalog = self.schedule.catalog
+        return [(catalog.names[name], catalog.venues[venue] if venue != NO_VENUE else None)
+                for name, venue in self.schedule.events(self.index)]
+
+    @property
+    def text(self):
+        return self.schedule.text(self.index)
+
+    def __repr__(self):
+        return f"ScheduleEntry({format_time(self.start)}-{format_time(self.end)}, {self.text!r})"
+
+
+# ----------------- Interval Tree -----------------
+class IntervalTree:
+    """Static centered interval tree over slot indices: stab queries in O(log n + k)."""
+
+    def __init__(self, starts, ends):
+        self.__starts = starts
+        self.__ends = ends
+        self.__root = self.__build(list(range(len(starts))))
+
+    def __build(self, slots):
+        if not slots:
+            return None
+        starts, ends = self.__starts, self.__ends
+        slots.sort(key=lambda slot: (starts[slot], ends[slot]))
+        middle = slots[len(slots) // 2]
+        center = (starts[middle] + ends[middle]) // 2
+        left, here, right = [], [], []
+        for slot in slots:
+            if ends[slot] <= center:
+                left.append(slot)
+            elif starts[slot] > center:
+                right.append(slot)
+            else:
+                here.append(slot)
+        by_end = tuple(sorted(here, key=lambda slot: ends[slot], reverse=True))
+        return (center, tuple(here), by_end, self.__build(left), self.__build(right))
+
+    def stab(self, point):
+        """Indices of slots with start <= point < end, ordered by (start, end)."""
+        starts, ends = self.__starts, self.__ends
+        found = []
+        node = self.__root
+        while node is not None:
+            center, by_start, by_end, left, right = node
+            if point < center:
+                for slot in by_start:
+                    if starts[slot] > point:
+                        break
+                    found.append(slot)
+                node = left
+            else:
+                for slot in by_end:
+                    if ends[slot] <= point:
+                        break
+                    found.append(slot)
+                node = right
+        found.sort()  # slots are numbered in (start, end) order
+        return found
+
+
+# ----------------- One Day of Events -----------------
+class DaySchedule:
+    """A day's slots as parallel array columns, sorted by (start, end).
+
+    starts / ends hold minutes of day; slot i's events are
+    names[event_ptr[i]:event_ptr[i + 1]] with the matching venues
+    (catalog ids, NO_VENUE when the text names none). No per-slot objects
+    are kept: ScheduleEntry views are made for the slots a query returns.
+    """
+
+    def __init__(self, slots, catalog):
+        # slots: iterable of (start minute, end minute, text)
+        slots = sorted(slots, key=lambda slot: (slot[0], slot[1]))
+        self.catalog = catalog
+        self.starts = array("H")
+        self.ends = array("H")
+        self.event_ptr = array("I", [0])
+        self.names = array("I")
+        self.venues = array("i")
+        for start, end, text in slots:
+            self.starts.append(start)
+            self.ends.append(max(end, start + 1))
+            for name, venue in catalog.parse(text):
+                self.names.append(name)
+                self.venues.append(venue)
+            self.event_ptr.append(len(self.names))
+        self.tree = IntervalTree(self.starts, self.ends)
+        self.__entries = None
+        # Inverted indexes: name / venue id -> the slots listing it, in start order
+        self.by_name = self.__postings(self.names)
+        self.by_venue = self.__postings(self.venues)
+
+    def __len__(self):
+        return len(self.starts)
+
+    @property
+    def entries(self):
+        """Every slot, as views; built on first use, for the days whose full listing is asked for."""
+        if self.__entries is None:
+            self.__entries = tuple(ScheduleEntry(self, index) for index in range(len(self.starts)))
+        return self.__entries
+
+    def events(self, index):
+        """[(name_id, venue_id)] of slot index."""
+        lo, hi = self.event_ptr[index], self.event_ptr[index + 1]
+        return list(zip(self.names[lo:hi], self.venues[lo:hi]))
+
+    def text(self, index):
+        render = self.catalog.render
+        return ", ".join(render(name, venue) for name, venue in self.events(index))
+
+    def starting_at(self, minute):
+        lo = bisect_left(self.starts, minute)
+        return self.__views(range(lo, bisect_right(self.starts, minute, lo)))
+
+    def running_at(self, minute):
+        return self.__views(self.tree.stab(minute))
+
+    def next_after(self, minute):
+        index = bisect_right(self.starts, minute)
+        if index == len(self.starts):
+            return []
+        return self.starting_at(self.starts[index])
+
+    def starting_between(self, start, end):
+        return self.__views(range(bisect_left(self.starts, start), bisect_left(self.starts, end)))
+
+    def with_venue(self, venue_id):
+        """Entries with at least one event at this venue."""
+        return self.__views(self.by_venue.get(venue_id, ()))
+
+    def with_event(self, name_id):
+        return self.__views(self.by_name.get(name_id, ()))
+
+    def __postings(self, column):
+        postings = {}
+        for index in range(len(self.starts)):
+            for position in range(self.event_ptr[index], self.event_ptr[index + 1]):
+                slots = postings.setdefault(column[position], [])
+                if not slots or slots[-1] != index:
+                    slots.append(index)
+        postings.pop(NO_VENUE, None)
+        return {key: tuple(slots) for key, slots in postings.items()}
+
+    def __views(self, indices):
+        return [ScheduleEntry(self, index) for index in indices]
+
+
+# ----------------- Schedule Store -----------------
+class ScheduleStore:
+    """Day-indexed schedule with real start/end times.
+
+    Answers "what's on at 4:15", "next event after 3 PM" and
+    "events between 2 and 6 PM" with bisection / an interval tree
+    instead of walking the day. Slot texts are parsed into interned
+    event / venue ids (one EventCatalog per store) and indexed both ways:
+    with_venue() / with_event() go straight from an id to the days and
+    slots that list it, without scanning the schedule.
+    """
+
+    def __init__(self, default_duration=60, catalog=None):
+        self.__default_duration = default_duration
+        self.catalog = catalog if catalog is not None else EventCatalog()
+        self.__days = {}
+        self.__order = {}       # day -> position, for ordering index results
+        self.__name_days = {}   # name id -> {day: None}, the days listing it
+        self.__venue_days = {}
+
+    @classmethod
+    def from_dict(cls, schedule, default_duration=60):
+        """Build from the {"day N": {"HH:MM": "events"}} layout the bots use.
+
+        Without explicit end times a slot lasts until the next slot of the
+        same day starts, capped at default_duration minutes.
+        """
+        store = cls(default_duration)
+        for day, slots in schedule.items():
+            store.set_day(day, slots.items())
+        return store
+
+    def set_day(self, day, slots):
+        """slots: iterable of ("HH:MM", text) or ("HH:MM", "HH:MM", text)."""
+        parsed = []
+        for slot in slots:
+            if len(slot) == 3:
+                start, end, text = slot
+                parsed.append((to_minutes(start), to_minutes(end), text))
+            else:
+                start, text = slot
+                parsed.append((to_minutes(start), None, text))
+        parsed.sort(key=lambda slot: slot[0])
+
+        rows = []
+        for index, (start, end, text) in enumerate(parsed):
+            if end is None:
+                end = start + self.__default_duration
+                for later_start, _, _ in parsed[index + 1:]:
+                    if later_start > start:
+                        end = min(end, later_start)
+                        break
+            rows.append((start, end, text))
+        self.__replace_day(day, DaySchedule(rows, self.catalog))
+
+    def updated(self, schedule):
+        """A new store matching schedule; this one is left untouched.
+
+        Days whose slots did not change keep their DaySchedule objects (and
+        so their rendered listings), and the catalog is shared, so a reload
+        costs only the edited days.
+        """
+        store = ScheduleStore(self.__default_duration, self.catalog)
+        for day, slots in schedule.items():
+            if day in self.__days and sorted(self.items(day)) == sorted(slots.items()):
+                store.__replace_day(day, self.__days[day])
+            else:
+                store.set_day(day, slots.items())
+        return store
+
+    def __replace_day(self, day, schedule):
+        old = self.__days.pop(day, None)
+        if old is not None:
+            self.__unindex(day, old.by_name, self.__name_days)
+            self.__unindex(day, old.by_venue, self.__venue_days)
+        self.__days[day] = schedule
+        self.__order.setdefault(day, len(self.__order))
+        for name_id in schedule.by_name:
+            self.__name_days.setdefault(name_id, {})[day] = None
+        for venue_id in schedule.by_venue:
+            self.__venue_days.setdefault(venue_id, {})[day] = None
+
+    @staticmethod
+    def __unindex(day, postings, days_of):
+        for key in postings:
+            days = days_of[key]
+            del days[day]
+            if not days:
+                del days_of[key]
+
+    def days(self):
+        return list(self.__days)
+
+    def day(self, day):
+        """The DaySchedule for a day (a new object after every change), or None."""
+        return self.__days.get(day)
+
+    def items(self, day):
+        """[("HH:MM", text)] for a day, in start order."""
+        schedule = self.__days.get(day)
+        if not schedule:
+            return []
+        return [(format_time(schedule.starts[index]), schedule.text(index)) for index in range(len(schedule))]
+
+    def at(self, day, time):
+        schedule = self.__days.get(day)
+        return schedule.running_at(to_minutes(time)) if schedule else []
+
+    def next_after(self, day, time):
+        schedule = self.__days.get(day)
+        return schedule.next_after(to_minutes(time)) if schedule else []
+
+    def between(self, day, start, end):
+        schedule = self.__days.get(day)
+        return schedule.starting_between(to_minutes(start), to_minutes(end)) if schedule else []
+
+    def with_venue(self, venue):
+        """[(day, entry)] of every slot with an event at venue (any case)."""
+        return self.venue_slots(self.catalog.venue_id(venue))
+
+    def with_event(self, name):
+        """[(day, entry)] of every slot listing the event called name (any case)."""
+        return self.event_slots(self.catalog.name_id(name))
+
+    def venue_slots(self, venue_id):
+        """with_venue() by catalog id."""
+        return self.__slots(self.__venue_days, venue_id, DaySchedule.with_venue)
+
+    def event_slots(self, name_id):
+        """with_event() by catalog id."""
+        return self.__slots(self.__name_days, name_id, DaySchedule.with_event)
+
+    def event_ids(self):
+        """Ids of the event names listed on some day right now."""
+        return list(self.__name_days)
+
+    def venue_ids(self):
+        return list(self.__venue_days)
+
+    def __slots(self, days_of, key, lookup):
+        days = days_of.get(key)
+        if not days:
+            return []
+        return [(day, entry) for day in sorted(days, key=self.__order.__getitem__)
+                for entry in lookup(self.__days[day], key)]
+
+
+# ----------------- Pre-rendered Day Listings -----------------
+class ScheduleRenderer:
+    """Renders each day's listing once, as display text and as speech text.
+
+    A day's blocks are cached against its DaySchedule object, which the store
+    replaces whenever that day changes, so only edited days are rebuilt and a
+    full-day query is otherwise a dictionary lookup.
+    """
+
+    def __init__(self, store, line="{time} – {event}", header="", separator="\n", trailer="",
+                 speech_line="At {time}, {event}.", speech_header="Here's the schedule for {day}."):
+        self.store = store
+        self.__options = (line, header, separator, trailer, speech_line, speech_header)
+        self.__line = line
+        self.__header = header
+        self.__separator = separator
+        self.__trailer = trailer
+        self.__speech_line = speech_line
+        self.__speech_header = speech_header
+        self.__cache = {}  # day -> (DaySchedule, text, speech)
+
+    def rebound(self, store):
+        """The same renderer over another store, keeping the listings of the days it shares with this one."""
+        renderer = ScheduleRenderer(store, *self.__options)
+        renderer.__cache = {day: block for day, block in self.__cache.items() if store.day(day) is block[0]}
+        return renderer
+
+    def text(self, day):
+        """Display listing for day, or None if the day has no events."""
+        block = self.__block(day)
+        return block[1] if block else None
+
+    def speech(self, day):
+        """The same listing phrased for text-to-speech, or None."""
+        block = self.__block(day)
+        return block[2] if block else None
+
+    def __block(self, day):
+        schedule = self.store.day(day)
+        if not schedule:
+            return None
+        cached = self.__cache.get(day)
+        if cached is None or cached[0] is not schedule:
+            cached = (schedule, self.__render_text(day, schedule), self.__render_speech(day, schedule))
+            self.__cache[day] = cached
+        return cached
+
+    def __render_text(self, day, schedule):
+        lines = self.__separator.join(self.__line.format(time=entry.time, event=entry.text)
+                                      for entry in schedule.entries)
+        return self.__header.format(day=day.title()) + lines + self.__trailer
+
+    def __render_speech(self, day, schedule):
+        sentences = [self.__speech_header.format(day=day.title())] if self.__speech_header else []
+        sentences.extend(self.__speech_line.format(time=spoken_minutes(entry.start), event=speakable(entry.text))
+                         for entry in schedule.entries)
+        return " ".join(sentences)
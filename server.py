@@ -0,0 +1,283 @@
+"""Asyncio HTTP + WebSocket front-end for any FestivalBot.
+
+    python server.py --port 8080
+
+    POST /query   {"query": "day 2 at 3 pm"}  ->  {"response": "..."}
+    GET  /health                               ->  {"status": "ok", ...}
+    GET  /stats                                ->  per-stage latency histograms (see instrumentation.py)
+    GET  /ws      WebSocket: every text frame is a query, every reply a text frame
+
+    python server.py --tenants festivals/     # one bot per festivals/*.json
+
+    POST /t/<tenant>/query, GET /t/<tenant>/ws  as above, for that tenant's bot
+    GET  /tenants                               ->  registry stats (see bot_registry.py)
+
+One process, one event loop, many concurrent sessions. Only the standard
+library is used.
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import importlib
+import itertools
+import json
+import struct
+import instrumentation
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_BODY = 64 * 1024
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           413: "Payload Too Large", 500: "Internal Server Error", 101: "Switching Protocols"}
+
+
+# ----------------- Bot Server -----------------
+class BotServer:
+    def __init__(self, bot, host="127.0.0.1", port=8080, registry=None):
+        # registry: a BotRegistry whose tenants are served under /t/<tenant>/
+        self.bot = bot
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self.sessions = 0
+        self.requests = 0
+        self.__session_ids = itertools.count(1)
+        self.__server = None
+
+    async def start(self):
+        self.__server = await asyncio.start_server(self.__handle_connection, self.host, self.port)
+        self.port = self.__server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self.__server is None:
+            await self.start()
+        async with self.__server:
+            await self.__server.serve_forever()
+
+    async def close(self):
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+
+    def answer(self, query, tenant=None):
+        self.requests += 1
+        if tenant is None:
+            return self.bot.handle_query(query)
+        return self.registry.handle_query(tenant, query)
+
+    async def __answer(self, query, tenant):
+        if tenant is not None and not self.registry.is_loaded(tenant):
+            # Building a cold tenant's bot takes a while; do it on a worker thread
+            # so every other session keeps being answered meanwhile
+            return await asyncio.get_running_loop().run_in_executor(None, self.answer, query, tenant)
+        return self.answer(query, tenant)
+
+    def __tenant(self, path):
+        """'/t/<tenant>/rest' -> (tenant, '/rest'); (None, path) for everything else."""
+        if self.registry is None or not path.startswith("/t/"):
+            return None, path
+        tenant, _, rest = path[3:].partition("/")
+        return tenant, "/" + rest
+
+    # ------------------- HTTP -------------------
+    async def __handle_connection(self, reader, writer):
+        session = next(self.__session_ids)
+        self.sessions += 1
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    return
+                method, path, headers = self.__parse_head(head)
+                if method is None:
+                    await self.__respond(writer, 400, {"error": "malformed request"}, keep_alive=False)
+                    return
+
+                tenant, route = self.__tenant(path)
+                if route == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                    if (tenant is None and self.bot is None) or (tenant is not None and tenant not in self.registry):
+                        await self.__respond(writer, 404, {"error": f"no bot for {path}"}, keep_alive=False)
+                        return
+                    await self.__websocket(reader, writer, headers, session, tenant)
+                    return
+
+                length = headers.get("content-length", "0")
+                length = int(length) if length.isdigit() else 0
+                if length > MAX_BODY:
+                    await self.__respond(writer, 413, {"error": "body too large"}, keep_alive=False)
+                    return
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    status, payload = await self.__route(method, path, body, session)
+                except Exception as error:  # a failing bot answers 500; the server and session carry on
+                    status, payload = 500, {"error": f"internal error: {type(error).__name__}"}
+                await self.__respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.sessions -= 1
+            writer.close()
+
+    @staticmethod
+    def __parse_head(head):
+        lines = head.decode("latin-1").split("\r\n")
+        parts = lines[0].split(" ")
+        if len(parts) != 3:
+            return None, None, None
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        return parts[0].upper(), parts[1].split("?", 1)[0], headers
+
+    async def __route(self, method, path, body, session):
+        if path == "/health":
+            return 200, {"status": "ok", "sessions": self.sessions, "requests": self.requests}
+        if path == "/stats":
+            return 200, {"instrumented": instrumentation.is_enabled(), "stages": instrumentation.stats()}
+        if path == "/tenants" and self.registry is not None:
+            return 200, self.registry.stats()
+        tenant, route = self.__tenant(path)
+        if route != "/query" or (tenant is None and self.bot is None):
+            return 404, {"error": f"no route for {path}"}
+        if tenant is not None and tenant not in self.registry:
+            return 404, {"error": f"no tenant {tenant!r}"}
+        if method != "POST":
+            return 405, {"error": "use POST"}
+        try:
+            query = json.loads(body or b"{}").get("query")
+        except (ValueError, AttributeError):
+            query = None
+        if not isinstance(query, str):
+            return 400, {"error": "expected JSON body like {\"query\": \"...\"}"}
+        return 200, {"response": await self.__answer(query, tenant), "session": session}
+
+    @staticmethod
+    async def __respond(writer, status, payload, keep_alive=True):
+        body = json.dumps(payload).encode("ascii")
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                "Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+    # ------------------- WebSocket -------------------
+    async def __websocket(self, reader, writer, headers, session, tenant=None):
+        key = headers.get("sec-websocket-key", "")
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+        writer.write(("HTTP/1.1 101 Switching Protocols\r\n"
+                      "Upgrade: websocket\r\nConnection: Upgrade\r\n"
+                      f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode("latin-1"))
+        await writer.drain()
+
+        message = []
+        while True:
+            opcode, fin, payload = await read_frame(reader)
+            if opcode == 0x8:    # close
+                writer.write(encode_frame(0x8, payload[:2]))
+                await writer.drain()
+                return
+            if opcode == 0x9:    # ping
+                writer.write(encode_frame(0xA, payload))
+                await writer.drain()
+                continue
+            if opcode in (0x1, 0x0):
+                message.append(payload)
+                if not fin:
+                    continue
+                query = b"".join(message).decode("utf-8", "replace")
+                message = []
+                try:
+                    reply = await self.__answer(query, tenant)
+                except Exception:  # close with 1011 (internal error) rather than just dropping the socket
+                    writer.write(encode_frame(0x8, struct.pack("!H", 1011)))
+                    await writer.drain()
+                    return
+                writer.write(encode_frame(0x1, reply.encode("utf-8")))
+                await writer.drain()
+
+
+async def read_frame(reader):
+    """(opcode, fin, payload) of one WebSocket frame, unmasking client data."""
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack("!Q", await reader.readexactly(8))[0]
+    if length > MAX_BODY:
+        raise ConnectionError("websocket frame too large")
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length) if length else b""
+    if mask:
+        payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+    return first & 0x0F, bool(first & 0x80), payload
+
+
+def encode_frame(opcode, payload, mask=None):
+    """One final WebSocket frame; clients must pass a 4-byte mask."""
+    head = bytearray([0x80 | opcode])
+    mask_bit = 0x80 if mask else 0
+    if len(payload) < 126:
+        head.append(mask_bit | len(payload))
+    elif len(payload) < 1 << 16:
+        head.append(mask_bit | 126)
+        head += struct.pack("!H", len(payload))
+    else:
+        head.append(mask_bit | 127)
+        head += struct.pack("!Q", len(payload))
+    if mask:
+        head += mask
+        payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+    return bytes(head) + payload
+
+
+def load_bot(spec):
+    """'module:Class' -> an instance of that FestivalBot."""
+    module_name, _, class_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), class_name or "TechnovateBot")()
+
+
+# ----------------- Run the Server -----------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--bot", default="bot_core:TechnovateBot",
+                        help="FestivalBot implementation to serve, as module:Class")
+    parser.add_argument("--tenants", help="directory of festival data files, one tenant each (/t/<name>/...)")
+    parser.add_argument("--memory-budget", type=int, default=64, help="MB of tenant bots kept loaded")
+    args = parser.parse_args()
+
+    registry = None
+    if args.tenants:
+        from bot_registry import BotRegistry
+        registry = BotRegistry.from_directory(args.tenants, memory_budget=args.memory_budget * 1024 * 1024)
+    server = BotServer(load_bot(args.bot), args.host, args.port, registry)
+
+    async def run():
+        await server.start()
+        print(f"Serving {args.bot} on http://{server.host}:{server.port} (POST /query, GET /ws)")
+        if registry is not None:
+            print(f"and {len(registry.tenants())} tenants from {args.tenants} (POST /t/<tenant>/query)")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if registry is not None:
+            registry.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,325 @@
+import re
+import threading
+import time
+from collections import deque
+from queue import Empty, Full, Queue
+import instrumentation
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def sentences(text):
+    """Split speech text into sentences (or lines), the chunks streaming mode speaks one by one."""
+    return [chunk.strip() for line in text.splitlines() for chunk in _SENTENCE_END.split(line) if chunk.strip()]
+
+
+# ----------------- Speech Worker -----------------
+class SpeechWorker:
+    """Owns the TTS engine on one long-lived thread and feeds it from a bounded queue.
+
+    A front-end creates one worker per process around a LazyEngine. Calling
+    start() early builds the engine on the worker thread while the window
+    draws, and prewarm(bot.known_speech()) fills the audio cache between
+    replies; with voice off neither is called, so the driver never loads
+    and the cache never looks for an audio player.
+
+    - say(text) with interrupt=True (the default) drops anything still queued
+      and cuts the current utterance off at its next word, so a new answer
+      never waits behind a stale one.
+    - Utterances that pile up while the engine is busy are coalesced and
+      spoken in one runAndWait() call.
+    - When the queue is full the oldest pending utterance is dropped.
+    - With an AudioCache, utterances synthesized before are played from
+      their WAV; anything else is synthesized into the cache first. prewarm()
+      synthesizes known sentences whenever there is nothing to say.
+    - An engine that fails to start, or a batch that raises, is counted in
+      stats()["errors"] and never kills the worker: the batch is dropped,
+      wait() returns, and a failed start is retried by the next say().
+    - stream=True speaks long replies sentence by sentence: the first one
+      starts as soon as it is ready, the next is synthesized while the
+      current one plays (with an AudioCache), and an interrupt takes effect
+      at the next sentence boundary at the latest.
+    """
+
+    def __init__(self, engine_factory, max_queue=8, latency_window=100, audio_cache=None, stream=False):
+        self.__engine_factory = engine_factory
+        self.__stream = stream
+        self.__audio_cache = audio_cache
+        self.__audio = None            # the cache once the worker found it usable
+        self.__prewarm = deque()       # texts to synthesize while idle
+        self.__idle = threading.Event()
+        self.__idle.set()
+        self.__queue = Queue(maxsize=max_queue)
+        self.__lock = threading.Lock()
+        self.__thread = None
+        self.__generation = 0          # bumped on every interrupt
+        self.__speaking_generation = None
+        self.__latencies = deque(maxlen=latency_window)
+        self.__counters = {"queued": 0, "spoken": 0, "coalesced": 0, "dropped": 0, "interrupted": 0,
+                           "cache_hits": 0, "cache_misses": 0, "prewarmed": 0, "errors": 0}
+
+    # ------------------- Public API -------------------
+    def start(self):
+        with self.__lock:
+            self.__start_locked()
+
+    def say(self, text, interrupt=True):
+        if not text:
+            return
+        with self.__lock:
+            # Started under the same lock as the enqueue, so an engine that fails
+            # to start drains this utterance too instead of leaving it stranded
+            self.__start_locked()
+            if interrupt:
+                self.__generation += 1
+                self.__drain_locked()
+            self.__idle.clear()
+            item = (text, time.perf_counter(), self.__generation)
+            while True:
+                try:
+                    self.__queue.put_nowait(item)
+                    break
+                except Full:
+                    self.__drop_oldest_locked()
+            self.__counters["queued"] += 1
+
+    def interrupt(self):
+        """Silence the current utterance and forget everything queued."""
+        with self.__lock:
+            self.__generation += 1
+            self.__drain_locked()
+            if self.__speaking_generation is None:
+                self.__idle.set()
+
+    def prewarm(self, texts):
+        """Synthesize texts into the audio cache in the background (no-op without one)."""
+        if self.__audio_cache is None:
+            return
+        with self.__lock:
+            for text in texts:
+                self.__prewarm.extend(self.__chunks(text))
+        self.start()
+        try:
+            self.__queue.put_nowait(())  # wakes the worker if it is waiting for speech
+        except Full:
+            pass  # busy speaking; it prewarms once the queue is empty
+
+    def wait(self, timeout=None):
+        """Block until everything queued has been spoken; False on timeout."""
+        return self.__idle.wait(timeout)
+
+    def stop(self):
+        self.interrupt()
+        with self.__lock:
+            thread, self.__thread = self.__thread, None
+        if thread is not None:
+            self.__queue.put(None)
+            thread.join(timeout=2)
+
+    @property
+    def alive(self):
+        """False until started, and again after the engine failed to start."""
+        thread = self.__thread
+        return thread is not None and thread.is_alive()
+
+    @property
+    def queue_depth(self):
+        return self.__queue.qsize()
+
+    def stats(self):
+        with self.__lock:
+            latencies = sorted(self.__latencies)
+            stats = dict(self.__counters)
+        stats["queue_depth"] = self.queue_depth
+        if latencies:
+            stats["latency_ms_avg"] = round(sum(latencies) / len(latencies) * 1000, 2)
+            stats["latency_ms_p50"] = round(latencies[len(latencies) // 2] * 1000, 2)
+            stats["latency_ms_max"] = round(latencies[-1] * 1000, 2)
+        return stats
+
+    # ------------------- Worker Thread -------------------
+    def __start_locked(self):
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__run, name="speech-worker", daemon=True)
+            self.__thread.start()
+
+    def __drain_locked(self):
+        while True:
+            try:
+                item = self.__queue.get_nowait()
+            except Empty:
+                return
+            if item:
+                self.__counters["dropped"] += 1
+
+    def __drop_oldest_locked(self):
+        try:
+            if self.__queue.get_nowait():
+                self.__counters["dropped"] += 1
+        except Empty:
+            pass
+
+    def __next_batch(self):
+        """Block for one utterance (unless there is prewarming to do), then coalesce whatever else is waiting.
+
+        Returns None to stop, or an empty list when there is nothing to say.
+        """
+        try:
+            item = self.__queue.get(block=not self.__prewarm)
+        except Empty:
+            return []
+        if item is None:
+            return None
+        batch = [item] if item else []  # () only wakes the worker up
+        while True:
+            try:
+                extra = self.__queue.get_nowait()
+            except Empty:
+                break
+            if extra is None:
+                self.__queue.put(None)
+                break
+            if extra:
+                batch.append(extra)
+        return batch
+
+    def __count(self, counter):
+        with self.__lock:
+            self.__counters[counter] += 1
+
+    def __interrupted(self):
+        return self.__speaking_generation != self.__generation
+
+    def __chunks(self, text):
+        return sentences(text) if self.__stream else [text] if text else []
+
+    def __cached_path(self, text):
+        """The WAV for text, synthesizing it now on a miss; None if the driver can't write one."""
+        path = self.__audio.lookup(text, self.__voice, self.__rate)
+        if path is not None:
+            self.__count("cache_hits")
+            return path
+        self.__count("cache_misses")
+        try:
+            path = self.__audio.synthesize(self.__engine, text)
+        except Exception:
+            return None
+        if path is not None and self.__interrupted():
+            self.__audio.discard(path)  # the engine may have been stopped mid-file
+            return None
+        return path
+
+    def __speak_live(self, texts):
+        """Straight through the engine; while streaming, one runAndWait() per sentence."""
+        if not self.__stream:
+            self.__engine.say("\n".join(texts))
+            self.__engine.runAndWait()
+            return
+        for text in texts:
+            for chunk in sentences(text):
+                if self.__interrupted():
+                    return
+                self.__engine.say(chunk)
+                self.__engine.runAndWait()
+
+    def __speak_cached(self, texts):
+        # Pipelined: chunk n plays on a helper thread while this (engine) thread
+        # looks up or synthesizes chunk n + 1
+        playing = None
+        try:
+            for chunk in (chunk for text in texts for chunk in self.__chunks(text)):
+                if self.__interrupted():
+                    return
+                path = self.__cached_path(chunk)
+                if playing is not None:
+                    playing.join()
+                    playing = None
+                if self.__interrupted():
+                    return
+                if path is None:
+                    self.__engine.say(chunk)
+                    self.__engine.runAndWait()
+                    continue
+                playing = threading.Thread(target=self.__audio.play, args=(path, self.__interrupted),
+                                           name="speech-playback", daemon=True)
+                playing.start()
+        finally:
+            if playing is not None:
+                playing.join()
+
+    def __prewarm_one(self):
+        if self.__audio is None:  # the cache turned out unusable
+            self.__prewarm.clear()
+            return
+        try:
+            text = self.__prewarm.popleft()
+        except IndexError:
+            return
+        try:
+            if self.__audio.synthesize(self.__engine, text) is not None:
+                self.__count("prewarmed")
+        except Exception:
+            pass  # the driver can't write files; it can still speak live
+
+    def __on_word(self, name, location, length):
+        if self.__speaking_generation is not None and self.__interrupted():  # never cut off prewarming
+            self.__engine.stop()
+
+    def __run(self):
+        try:
+            self.__engine = self.__engine_factory()
+            self.__engine.connect('started-word', self.__on_word)
+            cache = self.__audio_cache
+            if cache is not None and cache.available:
+                self.__voice, self.__rate = self.__engine.getProperty('voice'), self.__engine.getProperty('rate')
+                self.__audio = cache
+        except Exception:
+            # No engine (driver missing, no audio device): drop what was queued and
+            # let the next say() start a fresh thread and try again
+            with self.__lock:
+                self.__counters["errors"] += 1
+                self.__drain_locked()
+                if self.__thread is threading.current_thread():
+                    self.__thread = None
+                self.__idle.set()
+            return
+        while True:
+            batch = self.__next_batch()
+            if batch is None:
+                return
+            if not batch:
+                if self.__queue.empty():
+                    self.__prewarm_one()
+                continue
+            with self.__lock:
+                current = self.__generation
+                batch = [item for item in batch if item[2] == current]
+                if not batch:
+                    if self.__queue.empty():
+                        self.__idle.set()
+                    continue
+                now = time.perf_counter()
+                self.__latencies.extend(now - enqueued for _, enqueued, _ in batch)
+                self.__counters["coalesced"] += len(batch) - 1
+                self.__speaking_generation = current
+            started = time.perf_counter()
+            failed = False
+            try:
+                if self.__audio is not None:
+                    self.__speak_cached([text for text, _, _ in batch])
+                else:
+                    self.__speak_live([text for text, _, _ in batch])
+            except Exception:
+                failed = True  # e.g. "run loop already started"; this batch is lost, the worker is not
+            if instrumentation.is_enabled():
+                instrumentation.record("tts", time.perf_counter() - started)
+            with self.__lock:
+                if failed:
+                    self.__counters["errors"] += 1
+                elif self.__speaking_generation != self.__generation:
+                    self.__counters["interrupted"] += 1
+                else:
+                    self.__counters["spoken"] += 1
+                self.__speaking_generation = None
+                if self.__queue.empty():
+                    self.__idle.set()
@@ -0,0 +1,148 @@
+import re
+from collections import Counter
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Everyday English words long enough to be corrected, which a visitor types on
+# purpose and which sit an edit or two from festival words (ticket ~ cricket,
+# cancel ~ dance, dinner ~ runner): they are always left as typed
+COMMON_WORDS = frozenset("""
+    about above accept access account across action active activity actually address advance after
+    afternoon again against agenda ahead almost alone along already also always amount another answer
+    anybody anyone anything anyway anywhere appear apply around arrive arrival arrange asking attend
+    available awesome bathroom because become before begin behind believe better between booking bottle
+    bought breakfast bring broken brother building cancel cancelled cannot careful carry change
+    charge charger cheaper check choose church cinema city class classes clean clear close closed closing
+    clothes coffee coming common complete confirm contest cookie corner correct costume could couple
+    course cousin create credit crowd current daily danger dinner direction dirty doctor dollar double
+    during early easily either emergency enough entrance entry evening every everyone everything exact
+    example except exchange excited exit expect expensive explain family father favourite favorite feeling
+    female finally finish finished first follow forgot forget found friday friend friends further garden
+    general gentle getting ground guide happen happy hardly hello hospital hotel hours house hungry hurry
+    important inside instead interest invite itself jacket ladies later leave letter light likely
+    listen little local locker locked lonely lost lunch machine maybe medical medicine meeting member
+    mentor message middle minute minutes missing mobile moment monday money month morning mother movie
+    myself nearby nearest nearly needed never night nobody normal nothing notice number office officer
+    often online only opening option order others outside parent parents parking partner people perhaps
+    person phone photo photos picture place planning please pocket police policy possible prefer
+    present pretty price printer prize prizes probably problem public purse quickly quiet really reason
+    receipt receive recent refund remember rental repeat reply report request restroom result return
+    rules safety saturday second security seems seller service should shuttle sister sitting slowly
+    someone something sometimes soon sorry speaker special spend start started station still street
+    student students sunday sure system table taking taxi thanks their there these thing things think
+    thirsty though thought through thursday ticket tickets timing together toilet tomorrow tonight
+    totally transport travel tuesday understand unless update using usually venue village visit visitor
+    visitors volunteer volunteers waiting wallet washroom water wednesday weekend welcome whatever where
+    whether which while whole within without wonder working world worried would write wrong yesterday
+""".split())
+
+
+def deletes(word, distance):
+    """Every string made by deleting up to distance characters from word (word itself included)."""
+    found = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {variant[:index] + variant[index + 1:] for variant in frontier for index in range(len(variant))}
+        found |= frontier
+    return found
+
+
+def edit_distance(a, b, limit):
+    """Optimal-string-alignment distance (adjacent swaps count once), or limit + 1 once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        smallest = i
+        for j, char_b in enumerate(b, 1):
+            value = previous[j - 1] + (char_a != char_b)
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if previous2 is not None and j > 1 and char_a == b[j - 2] and a[i - 2] == char_b and char_a != char_b:
+                if previous2[j - 2] + 1 < value:
+                    value = previous2[j - 2] + 1
+            current.append(value)
+            if value < smallest:
+                smallest = value
+        if smallest > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+# ----------------- SymSpell-style Corrector -----------------
+class SpellingCorrector:
+    """Corrects query words against the bot's vocabulary with precomputed deletions.
+
+    Every vocabulary word is stored under each string obtained by deleting
+    up to max_distance of its letters. A query word is looked up the same
+    way, so finding its candidates takes a few dictionary lookups whatever
+    the vocabulary size; the closest candidate (then the most frequent)
+    replaces it. Only runs of letters are looked at, so numbers and times
+    pass through; words shorter than min_length, COMMON_WORDS and known
+    words (and their plurals) are left alone, and words up to short_length
+    letters may differ by one edit only.  Short words are left alone because
+    one edit turns too many real words into festival ones (good -> food,
+    lost -> last).
+    """
+
+    def __init__(self, vocabulary, known=(), max_distance=2, min_length=6, short_length=7, memo_size=4096):
+        # vocabulary: words corrections may produce (repeats raise a word's priority)
+        # known: further words that are right as typed but never a correction target
+        self.max_distance = max_distance
+        self.min_length = min_length
+        self.short_length = short_length
+        self.__frequency = Counter(word for word in vocabulary if len(word) >= min_length)
+        self.__known = set(self.__frequency).union(COMMON_WORDS, known)
+        self.__deletes = {}
+        for word in self.__frequency:
+            for variant in deletes(word, max_distance):
+                self.__deletes.setdefault(variant, []).append(word)
+        self.__memo = {}
+        self.__memo_size = memo_size
+
+    def __len__(self):
+        return len(self.__frequency)
+
+    def correct(self, text):
+        """text with misspelled words replaced (the same string if nothing changed)."""
+        words = _WORD_RE.findall(text)
+        if self.__known.issuperset(words) or all(
+                len(word) < self.min_length or self.__is_known(word) for word in words):
+            return text
+        return _WORD_RE.sub(lambda match: self.correct_word(match.group()), text)
+
+    def correct_word(self, word):
+        if len(word) < self.min_length or self.__is_known(word):
+            return word
+        corrected = self.__memo.get(word)
+        if corrected is None:
+            if len(self.__memo) >= self.__memo_size:
+                self.__memo.clear()
+            corrected = self.__memo[word] = self.__lookup(word)
+        return corrected
+
+    def __is_known(self, word):
+        # a known word's plural is spelled right too ("events", "workshops")
+        return word in self.__known or (word[-1] == "s" and word[:-1] in self.__known)
+
+    def __lookup(self, word):
+        limit = 1 if len(word) <= self.short_length else self.max_distance
+        best, best_key = word, None
+        seen = set()
+        for variant in deletes(word, limit):
+            for candidate in self.__deletes.get(variant, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = edit_distance(word, candidate, limit)
+                if distance > limit:
+                    continue
+                key = (distance, -self.__frequency[candidate], candidate)
+                if best_key is None or key < best_key:
+                    best, best_key = candidate, key
+        return best
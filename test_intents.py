@@ -0,0 +1,93 @@
+"""Regression tests: every command phrase, and queries that once broke, still reach the right intent.
+
+Run from the repository root:  python -m unittest test_intents  (or python -m pytest)
+"""
+import unittest
+
+from bot_core import TechnovateBot
+from festival_data import DEFAULT_PATH, load
+
+# (query, intent it must get) beyond the command phrases themselves
+EXPECTED = [
+    ("how to register", "registration_info"),
+    ("how do i register", "registration_info"),
+    ("register for events", "event_registration"),
+    ("what's the theme", "theme"),
+    ("help me", "help"),
+    ("cnteen timings", "food_info"),
+    ("is accmomodation available", "accommodation_info"),
+    ("good morning", "unknown"),
+    ("can i cancel my registration", "unknown"),
+    ("day 1 at 6 pm at the sports complex", "event_at"),
+    ("what's on in the auditorium day 2 at 3 pm", "event_at"),
+    ("what's at the auditorium on day 2", "venue"),
+    ("when is cricket", "event"),
+]
+
+# Off-topic queries that only some answer text (or one word of a keyword) mentions
+OFF_TOPIC = [
+    "is there parking",
+    "where is the main gate",
+    "is wifi available",
+    "what time does the gate open",
+    "where is the registration desk",
+    "what's the weather like",
+]
+
+# Queries naming an event or venue that still ask an FAQ
+FAQ_OVER_VENUE = [
+    ("where is the food court", "food_info"),
+    ("is there food in the auditorium", "food_info"),
+    ("can i perform in the auditorium", "open_stage"),
+    ("how do i register for events in the auditorium", "event_registration"),
+    ("where do i register for cricket", "registration_info"),
+]
+
+# Spellings that answer() and answer_many() must treat as the same query
+WHITESPACE_VARIANTS = ["day  2 at 3 pm", "day\t1", "  Day 2   between 2 and 6 pm ", "what's  the theme"]
+
+
+def command_phrases(data):
+    """(phrase, intent) for each FAQ entry, first entry of a phrase only."""
+    seen = {}
+    for intent, phrase, _, _ in data.faq:
+        seen.setdefault(phrase.lower(), intent)
+    return list(seen.items())
+
+
+class IntentTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.bot = TechnovateBot(DEFAULT_PATH)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.bot.close()
+
+    def assertIntents(self, cases):
+        for query, intent in cases:
+            with self.subTest(query=query):
+                self.assertEqual(self.bot.answer(query).intent, intent, self.bot.rank_intents(query))
+
+    def test_command_phrases(self):
+        self.assertIntents(command_phrases(load(DEFAULT_PATH)))
+
+    def test_known_queries(self):
+        self.assertIntents(EXPECTED)
+
+    def test_off_topic_queries_are_not_understood(self):
+        self.assertIntents([(query, "unknown") for query in OFF_TOPIC])
+
+    def test_faq_wins_over_named_venue_or_event(self):
+        self.assertIntents(FAQ_OVER_VENUE)
+
+    def test_batch_answers_match_single_answers(self):
+        batch = self.bot.answer_many(WHITESPACE_VARIANTS)
+        for query, reply in zip(WHITESPACE_VARIANTS, batch):
+            with self.subTest(query=query):
+                single = self.bot.answer(query)
+                self.assertEqual((reply.intent, reply.text), (single.intent, single.text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import re
+from bisect import bisect_right
+
+# Festival events run roughly 9 AM to 9 PM, so a clock time given without
+# AM/PM ("4:30", "half past four") below this hour is read as afternoon.
+ASSUME_PM_BEFORE = 9
+
+_WORD_HOURS = {
+    "one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6,
+    "seven": 7, "eight": 8, "nine": 9, "ten": 10, "eleven": 11, "twelve": 12,
+}
+_HOUR_WORD = "|".join(_WORD_HOURS)
+# Every word the patterns below read, so a spelling corrector leaves them alone
+TIME_WORDS = frozenset(list(_WORD_HOURS) + "noon midday midnight half quarter past to oclock o clock am pm "
+                       "between from and till until".split())
+_MERIDIEM = r"(?:\s*(?P<{0}>[ap])\.?\s*m\b\.?)"
+
+# One alternation, compiled once; finditer walks the text a single time.  Both
+# branches start with a plain digit or letter so the regex engine can skip
+# ahead quickly; whether a candidate really is a time is decided in Python.
+# Patterns are lowercase-only: the functions below lower() the text, which is much
+# cheaper than matching with re.IGNORECASE.
+_TIME_RE = re.compile(
+    r"(?P<number>\d+)(?::(?P<minute>\d\d))?" + _MERIDIEM.format("meridiem") + "?"  # 3pm, 4:30 pm, 15:00
+    + r"|\b(?P<word>noon|midday|midnight|half|quarter|" + _HOUR_WORD + r")\b"
+    + r"(?:\s+(?P<direction>past|to)\s+(?P<target>" + _HOUR_WORD + r"|\d{1,2})\b)?"  # half past four
+    + r"(?:\s+(?P<oclock>o'?clock)\b)?"  # four o'clock
+    + _MERIDIEM.format("word_meridiem") + "?",  # four pm, quarter to 6 pm
+)
+
+_RANGE_RE = re.compile(
+    r"\b(?:between|from)\s+(?P<start>\d{1,2}(?::[0-5]\d)?)(?:" + _MERIDIEM.format("start_meridiem") + r")?"
+    r"\s*(?:and|to|till|until|-)\s*"
+    r"(?P<end>\d{1,2}(?::[0-5]\d)?)(?:" + _MERIDIEM.format("end_meridiem") + r")?",
+)
+
+_SEPARATOR = "\0"  # never part of a time expression, so matches can't straddle two texts
+
+
+def _hour_value(token):
+    return _WORD_HOURS.get(token) or int(token)
+
+
+def _apply_meridiem(hour, meridiem):
+    """12-hour clock + 'a'/'p' (or None) -> hour of day, or None if impossible."""
+    if meridiem:
+        if not 1 <= hour <= 12:
+            return hour if meridiem == "p" and 13 <= hour <= 23 else None
+        if meridiem == "a":
+            return 0 if hour == 12 else hour
+        return 12 if hour == 12 else hour + 12
+    if 1 <= hour < ASSUME_PM_BEFORE:
+        return hour + 12
+    return hour if hour <= 23 else None
+
+
+def _match_minutes(match):
+    """Minutes from midnight for one _TIME_RE match, or None if it is not a real time."""
+    group = match.group
+    number = group("number")
+    if number is not None:
+        minute = group("minute")
+        if len(number) > 2 or (minute is not None and int(minute) > 59):
+            return None
+        hour = int(number)
+        if group("meridiem"):
+            hour = _apply_meridiem(hour, group("meridiem"))
+        elif minute is None:
+            return None  # a bare number ("day 2") is not a time
+        elif number.startswith("0") or hour > 12:
+            hour = hour if hour <= 23 else None  # 24-hour clock
+        else:
+            hour = _apply_meridiem(hour, None)
+        return None if hour is None else hour * 60 + int(minute or 0)
+
+    word = group("word")
+    if word == "midnight":
+        return 0
+    if word in ("noon", "midday"):
+        return 12 * 60
+    if word in ("half", "quarter"):
+        if group("direction") is None:
+            return None
+        hour = _apply_meridiem(_hour_value(group("target")), group("word_meridiem"))
+        if hour is None:
+            return None
+        offset = 30 if word == "half" else 15
+        minutes = hour * 60 + (offset if group("direction") == "past" else -offset)
+        return minutes % (24 * 60)
+    if group("oclock") is None and group("word_meridiem") is None:
+        return None  # "one of the events"
+    hour = _apply_meridiem(_WORD_HOURS[word], group("word_meridiem"))
+    return None if hour is None else hour * 60
+
+
+def format_time(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def parse_minutes(text):
+    """First time expression in text as minutes from midnight, or None."""
+    for match in _TIME_RE.finditer(text.lower()):
+        minutes = _match_minutes(match)
+        if minutes is not None:
+            return minutes
+    return None
+
+
+def extract_time(text):
+    """First time expression in text as "HH:MM", or None.
+
+    Understands "3pm", "3 PM", "15:00", "4:30pm", "noon" and
+    "half past four" without raising on ordinary words.
+    """
+    minutes = parse_minutes(text)
+    return None if minutes is None else format_time(minutes)
+
+
+def extract_times(texts):
+    """Batch extract_time: one finditer over all texts joined together."""
+    if not texts:
+        return []
+    buffer = _SEPARATOR.join(texts).lower()
+    starts = [0]
+    position = buffer.find(_SEPARATOR)
+    while position != -1:
+        starts.append(position + 1)
+        position = buffer.find(_SEPARATOR, position + 1)
+
+    results = [None] * len(texts)
+    for match in _TIME_RE.finditer(buffer):
+        index = bisect_right(starts, match.start()) - 1
+        if results[index] is None:
+            minutes = _match_minutes(match)
+            if minutes is not None:
+                results[index] = format_time(minutes)
+    return results
+
+
+def extract_range(text):
+    """("HH:MM", "HH:MM") for "between 2 and 6 PM" style phrases, or None.
+
+    A start without AM/PM borrows the end's, unless that would put it after the end.
+    """
+    match = _RANGE_RE.search(text.lower())
+    if not match:
+        return None
+    end_meridiem = match.group("end_meridiem")
+    start_meridiem = match.group("start_meridiem") or end_meridiem
+
+    def clock(token, meridiem):
+        hour, _, minute = token.partition(":")
+        hour = _apply_meridiem(int(hour), meridiem)
+        return None if hour is None else hour * 60 + int(minute or 0)
+
+    end = clock(match.group("end"), end_meridiem)
+    start = clock(match.group("start"), start_meridiem)
+    if start is not None and end is not None and start > end and not match.group("start_meridiem"):
+        start = clock(match.group("start"), "a")
+    if start is None or end is None:
+        return None
+    return format_time(start), format_time(end)
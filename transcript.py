@@ -0,0 +1,60 @@
+import shutil
+import tempfile
+import tkinter as tk
+from instrumentation import timed
+
+
+# ----------------- Bounded Chat Transcript -----------------
+class Transcript:
+    """Keeps a Tk text widget at a bounded number of lines.
+
+    Tags are configured once up front. When the widget grows past
+    max_lines + trim_chunk, the oldest lines are cut in one chunk and spooled
+    to a temporary file, so the widget (and memory) stay flat however long
+    the session runs. save() writes the complete history to disk on demand.
+    """
+
+    def __init__(self, widget, styles, max_lines=2000, trim_chunk=250):
+        self.widget = widget
+        self.max_lines = max_lines
+        self.trim_chunk = trim_chunk
+        self.__spool = None  # trimmed history, opened on first trim
+        for tag, options in styles.items():
+            widget.tag_configure(tag, **options)
+
+    @timed("render")
+    def append(self, text, tags=()):
+        self.widget.config(state='normal')
+        self.widget.insert(tk.END, text, tags)
+        self.__trim()
+        self.widget.config(state='disabled')
+        self.widget.yview(tk.END)
+
+    @property
+    def line_count(self):
+        return int(self.widget.index("end-1c").split(".")[0])
+
+    def __trim(self):
+        lines = self.line_count
+        if lines <= self.max_lines + self.trim_chunk:
+            return
+        cut = f"{lines - self.max_lines + 1}.0"
+        if self.__spool is None:
+            self.__spool = tempfile.TemporaryFile(mode="w+", encoding="utf-8", errors="surrogatepass")
+        self.__spool.write(self.widget.get("1.0", cut))
+        self.widget.delete("1.0", cut)
+
+    def save(self, path):
+        """Write the full session (trimmed lines included) to path."""
+        with open(path, "w", encoding="utf-8", errors="surrogatepass") as archive:
+            if self.__spool is not None:
+                self.__spool.flush()
+                self.__spool.seek(0)
+                shutil.copyfileobj(self.__spool, archive)
+                self.__spool.seek(0, 2)
+            archive.write(self.widget.get("1.0", "end-1c"))
+
+    def close(self):
+        if self.__spool is not None:
+            self.__spool.close()
+            self.__spool = None
@@ -0,0 +1,39 @@
+import threading
+
+
+# ----------------- Lazily Created TTS Engine -----------------
+class LazyEngine:
+    """pyttsx3 engine that is only imported and initialised on first use.
+
+    Importing a bot module, or running it text-only, never touches the
+    speech driver. The speech worker calls get() on its own thread, so
+    starting the worker early is what warms the engine up.
+    """
+
+    def __init__(self, rate=160, voice_index=None):
+        self.__rate = rate
+        self.__voice_index = voice_index
+        self.__engine = None
+        self.__lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self.__engine is not None
+
+    def get(self):
+        engine = self.__engine
+        if engine is None:
+            with self.__lock:
+                if self.__engine is None:
+                    self.__engine = self.__create()
+                engine = self.__engine
+        return engine
+
+    def __create(self):
+        import pyttsx3  # deferred: loading the driver is the expensive part
+
+        engine = pyttsx3.init()
+        engine.setProperty('rate', self.__rate)
+        if self.__voice_index is not None:
+            engine.setProperty('voice', engine.getProperty('voices')[self.__voice_index].id)
+        return engine